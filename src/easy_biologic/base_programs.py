@@ -1,6 +1,8 @@
 import os
 import math
 import time
+import statistics
+import itertools
 from datetime import datetime as dt
 import asyncio
 from collections import namedtuple
@@ -256,6 +258,9 @@ def map_hardware_params(params, by_channel=True, keep=False, inplace=False):
     )
 
 
+OCV_Datum = namedtuple("OCV_Datum", ["time", "voltage"])
+
+
 class OCV(BiologicProgram):
     """Runs an open circuit voltage scan."""
 
@@ -286,7 +291,7 @@ class OCV(BiologicProgram):
         )
 
         self.field_titles = ["Time [s]", "Voltage [V]"]
-        self._fields = namedtuple("OCV_Datum", ["time", "voltage"])
+        self._fields = OCV_Datum
         self._field_values = lambda datum, segment: (  # calculate fields
             dp.calculate_time(  # time
                 datum.t_high, datum.t_low, segment.info, segment.values
@@ -311,6 +316,9 @@ class OCV(BiologicProgram):
         self._run("ocv", params, retrieve_data=retrieve_data)
 
 
+CA_Datum = namedtuple("CA_Datum", ["time", "voltage", "current", "power", "cycle"])
+
+
 class CA(BiologicProgram):
     """Runs a chrono-amperometry technqiue."""
 
@@ -362,9 +370,7 @@ class CA(BiologicProgram):
             "Cycle",
         ]
 
-        self._fields = namedtuple(
-            "CA_Datum", ["time", "voltage", "current", "power", "cycle"]
-        )
+        self._fields = CA_Datum
 
         self._field_values = lambda datum, segment: (
             dp.calculate_time(datum.t_high, datum.t_low, segment.info, segment.values),
@@ -437,6 +443,9 @@ class CA(BiologicProgram):
             self.device.update_parameters(ch, "ca", params, types=self._parameter_types)
 
 
+CP_Datum = namedtuple("CP_Datum", ["time", "voltage", "current", "power", "cycle"])
+
+
 # TODO: update docstrings
 class CP(BiologicProgram):
     """Runs a chrono-potentiometry technqiue."""
@@ -487,9 +496,7 @@ class CP(BiologicProgram):
             "Cycle",
         ]
 
-        self._fields = namedtuple(
-            "CP_Datum", ["time", "voltage", "current", "power", "cycle"]
-        )
+        self._fields = CP_Datum
 
         self._field_values = lambda datum, segment: (
             dp.calculate_time(datum.t_high, datum.t_low, segment.info, segment.values),
@@ -562,6 +569,11 @@ class CP(BiologicProgram):
             self.device.update_parameters(ch, "cp", params, types=self._parameter_types)
 
 
+CALimit_Datum = namedtuple(
+    "CALimit_Datum", ["time", "voltage", "current", "power", "cycle"]
+)
+
+
 class CALimit(BiologicProgram):
     """Runs a cyclic amperometry technqiue."""
 
@@ -621,9 +633,7 @@ class CALimit(BiologicProgram):
             "Cycle",
         ]
 
-        self._fields = namedtuple(
-            "CALimit_Datum", ["time", "voltage", "current", "power", "cycle"]
-        )
+        self._fields = CALimit_Datum
 
         self._field_values = lambda datum, segment: (
             dp.calculate_time(datum.t_high, datum.t_low, segment.info, segment.values),
@@ -711,6 +721,27 @@ class CALimit(BiologicProgram):
             )
 
 
+PEIS_datum = namedtuple(
+    "PEIS_datum",
+    [
+        "process",
+        "time",
+        "voltage",
+        "current",
+        "abs_voltage",
+        "abs_current",
+        "impedance_phase",
+        "impedance_modulus",
+        "voltage_ce",
+        "abs_voltage_ce",
+        "abs_current_ce",
+        "impedance_ce_phase",
+        "impedance_ce_modulus",
+        "frequency",
+    ],
+)
+
+
 class PEIS(BiologicProgram):
     """Runs Potentio Electrochemical Impedance Spectroscopy technique."""
 
@@ -790,25 +821,7 @@ class PEIS(BiologicProgram):
             "Frequency [Hz]",
         ]
 
-        self._fields = namedtuple(
-            "PEIS_datum",
-            [
-                "process",
-                "time",
-                "voltage",
-                "current",
-                "abs_voltage",
-                "abs_current",
-                "impedance_phase",
-                "impedance_modulus",
-                "voltage_ce",
-                "abs_voltage_ce",
-                "abs_current_ce",
-                "impedance_ce_phase",
-                "impedance_ce_modulus",
-                "frequency",
-            ],
-        )
+        self._fields = PEIS_datum
 
         def _peis_fields(datum, segment):
             """
@@ -892,6 +905,27 @@ class PEIS(BiologicProgram):
         data = self._run("peis", params, retrieve_data=retrieve_data)
 
 
+GEIS_datum = namedtuple(
+    "GEIS_datum",
+    [
+        "process",
+        "time",
+        "voltage",
+        "current",
+        "abs_voltage",
+        "abs_current",
+        "impedance_phase",
+        "impedance_modulus",
+        "voltage_ce",
+        "abs_voltage_ce",
+        "abs_current_ce",
+        "impedance_ce_phase",
+        "impedance_ce_modulus",
+        "frequency",
+    ],
+)
+
+
 class GEIS(BiologicProgram):
     """Runs Galvano Electrochemical Impedance Spectroscopy technique."""
 
@@ -975,25 +1009,7 @@ class GEIS(BiologicProgram):
             "Frequency [Hz]",
         ]
 
-        self._fields = namedtuple(
-            "GEIS_datum",
-            [
-                "process",
-                "time",
-                "voltage",
-                "current",
-                "abs_voltage",
-                "abs_current",
-                "impedance_phase",
-                "impedance_modulus",
-                "voltage_ce",
-                "abs_voltage_ce",
-                "abs_current_ce",
-                "impedance_ce_phase",
-                "impedance_ce_modulus",
-                "frequency",
-            ],
-        )
+        self._fields = GEIS_datum
 
         def _geis_fields(datum, segment):
             """
@@ -1076,6 +1092,9 @@ class GEIS(BiologicProgram):
         data = self._run("geis", params, retrieve_data=retrieve_data)
 
 
+CV_Datum = namedtuple("CV_Datum", ["voltage", "current", "time", "power", "cycle"])
+
+
 class CV(BiologicProgram):
     """Runs a CV scan."""
 
@@ -1143,9 +1162,7 @@ class CV(BiologicProgram):
             "Cycle",
         ]
 
-        self._fields = namedtuple(
-            "CV_Datum", ["voltage", "current", "time", "power", "cycle"]
-        )
+        self._fields = CV_Datum
 
         self._field_values = lambda datum, segment: (
             datum.voltage,
@@ -1163,11 +1180,6 @@ class CV(BiologicProgram):
         # setup scan profile ( start -> end -> start )
         params = {}
         for ch, ch_params in self.params.items():
-            """ "
-            # Previously voltage_profile:
-            voltage_profile = [ ch_params[ 'start' ] ]* 5
-            voltage_profile[ 1 ] = ch_params[ 'end' ]
-            """
             voltage_profile = [
                 ch_params["start"],
                 ch_params["end"],
@@ -1175,11 +1187,12 @@ class CV(BiologicProgram):
                 ch_params["start"],
                 ch_params["Ef"],
             ]
+            steps = len(voltage_profile)
 
             params[ch] = {
-                "vs_initial": [ch_params["vs_initial"]] * 5,
+                "vs_initial": [ch_params["vs_initial"]] * steps,
                 "Voltage_step": voltage_profile,
-                "Scan_Rate": [ch_params["rate"]] * 5,
+                "Scan_Rate": [ch_params["rate"]] * steps,
                 "Scan_number": 2,
                 "Record_every_dE": ch_params["step"],
                 "Average_over_dE": ch_params["average"],
@@ -1260,6 +1273,7 @@ class MPP_Tracking(CALimit):
 
         # timers
         self.last_probe = time.time()
+        self._last_retrieval = time.monotonic()
 
         # timeout callbacks
         self._cb_timeout = []
@@ -1296,36 +1310,48 @@ class MPP_Tracking(CALimit):
 
         self._cb_timeout.append(callback)
 
-    def run(self, folder=None, by_channel=False):
+    def run(self, folder=None, by_channel=False, flush_every=None):
         """
         :param folder: Folder or file for saving data or
             None if automatic saving is not desired.
             Should be folder if by_channel is False, and file if True.
             [Default: None]
         :param by_channel: Save data by channel. [Default: False]
+        :param flush_every: Number of unsaved data points on any channel
+            after which intermediate data is saved,
+            or None to save after every probe.
+            Combine with data_window to bound memory use of long runs.
+            [Default: None]
         """
         # start callbacks
         for cb in self._cb_timeout:
             cb.start()
 
         super().run(retrieve_data=False)
-        self._hold_and_probe(folder, by_channel=by_channel)  # hold and probe
+        self._hold_and_probe(
+            folder, by_channel=by_channel, flush_every=flush_every
+        )  # hold and probe
 
         # program end
         if self.autoconnect is True:
             self._disconnect()
 
         self.save_data(folder, by_channel=by_channel)
+        self.wait_for_saves()
 
     # --- helper functions ---
 
-    def _hold_and_probe(self, folder=None, by_channel=False):
+    def _hold_and_probe(self, folder=None, by_channel=False, flush_every=None):
         """
         :param folder: Folder or file for saving data or
             None if automatic saving is not desired.
             Should be folder if by_channel is False, and file if True.
             [Default: None]
         :param by_channel: Save data by channel. [Default: False]
+        :param flush_every: Number of unsaved data points on any channel
+            after which intermediate data is saved,
+            or None to save after every probe.
+            [Default: None]
         """
         # calculate hold and probe times
         # actual hold and probe times are taken as the minimum of sum across the channels.
@@ -1347,16 +1373,16 @@ class MPP_Tracking(CALimit):
         hold_time = hold_times[key_channel]
         probe_time = probe_times[key_channel]
 
+        self._last_retrieval = time.monotonic()
+
+        stopped = False
         while True:
             # loop until measurement ends
 
             if (  # stop signal received
                 self._stop_event is not None and self._stop_event.is_set()
             ):
-                logging.warning(
-                    "Halting program on channels {}.".format(", ".join(self.channels))
-                )
-
+                stopped = True
                 break
 
             # callbacks
@@ -1364,12 +1390,12 @@ class MPP_Tracking(CALimit):
                 cb.call()
 
             # hold
-            (self.active_channels, hold_segments) = asyncio.run(
+            self.active_channels, hold_segments, stopped = asyncio.run(
                 self._hold_and_retrieve(hold_time)
             )
 
-            if len(self.active_channels) == 0:
-                # program end
+            if stopped or (len(self.active_channels) == 0):
+                # stop signal received during hold, do not probe, or program end
                 break
 
             # probe
@@ -1377,13 +1403,14 @@ class MPP_Tracking(CALimit):
                 ch: self.v_mpp[ch] + self.probe_steps[ch] for ch in self.active_channels
             }
 
-            self.update_voltages(probe_voltages)
-            (self.active_channels, probe_segments) = asyncio.run(
+            self._set_voltages(probe_voltages)
+            self.active_channels, probe_segments, stopped = asyncio.run(
                 self._hold_and_retrieve(probe_time)
             )
 
-            if len(self.active_channels) == 0:
-                # program end
+            if stopped or (len(self.active_channels) == 0):
+                # stop signal received during probe, do not update v_mpp,
+                # or program end
                 break
 
             # compare powers
@@ -1391,32 +1418,61 @@ class MPP_Tracking(CALimit):
 
             # set new v_mpp
             self._new_v_mpp(powers)
-            self.update_voltages(self.v_mpp)
+            self._set_voltages(self.v_mpp)
 
             # save intermediate data
-            if folder is not None:
+            if (folder is not None) and (
+                (flush_every is None)
+                or max(
+                    len(self._data[ch]) - self._save_cursor[ch] for ch in self.channels
+                )
+                >= flush_every
+            ):
                 self.save_data(folder, by_channel=by_channel)
 
+        if stopped:
+            logging.warning(f"Halting program on channels {self.channels}.")
+
+    def _set_voltages(self, voltages):
+        """Sets the voltage of the single tracking step.
+        Only the voltage is updated, as the number of steps
+        is fixed during tracking.
+
+        :param voltages: Dictionary of voltages keyed by channel.
+        """
+        for ch, voltage in voltages.items():
+            self.device.update_parameters(
+                ch, "calimit", {"Voltage_step": voltage}, types=self._parameter_types
+            )
+
     async def _hold_and_retrieve(self, duration):
         """Wait for a given time, then retrieve data.
 
-        :param duration: Time since last probe in seconds.
+        :param duration: Time since last retrieval in seconds.
+        :returns: Tuple of ( active, segments, stopped ) where
+            active is a list of channels still running,
+            segments is a dictionary of DataSegments keyed by channel, and
+            stopped is whether the stop event was set while waiting.
         """
         # wait, if needed
-        if duration > 0:
+        # measured from last retrieval so time spent updating is not added
+        stopped = False
+        remaining = self._last_retrieval + duration - time.monotonic()
+        if remaining > 0:
             # duration not yet reached
-            await asyncio.sleep(duration)
+            stopped = await self._wait(remaining)
 
         self.last_probe = time.time()  # reset last probe time
+        self._last_retrieval = time.monotonic()
 
         segments = await self._retrieve_data_segments()
         active = [
             ch
             for ch, segment in segments.items()
-            if (ecl.ChannelState(segment.values.State) is ecl.ChannelState.RUN)
+            if segment.values.State == self._RUN_STATE
         ]
 
-        return (active, segments)
+        return (active, segments, stopped)
 
     def _calculate_powers(self, hold_segments, probe_segments):
         powers = {
@@ -1424,21 +1480,18 @@ class MPP_Tracking(CALimit):
             for ch in self.active_channels
         }
 
-        return powers
+        # channels without data to compare are not updated this cycle
+        return {ch: power for ch, power in powers.items() if power is not None}
 
     def _calculate_power(self, hold_data, probe_data):
         # normalize compare times
         cmp_len = min(len(hold_data), len(probe_data))
-        hold_data = hold_data[-cmp_len:]
-        probe_data = probe_data[-cmp_len:]
+        if cmp_len == 0:
+            # no data to compare
+            return None
 
-        # get power
-        hold = [datum.voltage * datum.current for datum in hold_data]
-        probe = [datum.voltage * datum.current for datum in probe_data]
-
-        # take mean
-        hold = sum(hold) / len(hold)
-        probe = sum(probe) / len(probe)
+        hold = mean_power(hold_data, cmp_len)
+        probe = mean_power(probe_data, cmp_len)
 
         return MPP_Powers(hold, probe)
 
@@ -1451,9 +1504,10 @@ class MPP_Tracking(CALimit):
                 # probe was worse, move in opposite direction
                 self.probe_steps[ch] *= -1
 
-        # update v_mpp
+        # update v_mpp of compared channels
         self.v_mpp = {
-            ch: v_mpp + self.probe_steps[ch] for ch, v_mpp in self.v_mpp.items()
+            ch: (v_mpp + self.probe_steps[ch]) if (ch in powers) else v_mpp
+            for ch, v_mpp in self.v_mpp.items()
         }
 
 
@@ -1569,11 +1623,10 @@ class MPP(MPP_Tracking):
         ocv_pg.save_data(file, by_channel=by_channel)
 
         voc = {
-            ch: [datum.voltage for datum in data] for ch, data in ocv_pg.data.items()
+            ch: statistics.fmean(datum.voltage for datum in data)
+            for ch, data in ocv_pg.data.items()
         }
 
-        voc = {ch: sum(ch_voc) / len(ch_voc) for ch, ch_voc in voc.items()}
-
         return voc
 
     def _run_cv(self, voc, file, by_channel=False, cv_params={}):
@@ -1660,8 +1713,10 @@ class MPP_Cycles(MPP):
         folder = os.path.join(folder, cycle_path)
 
         # reset data
+        self.wait_for_saves()
         for ch in self.channels:
             self._data[ch] = []
+            self._save_cursor[ch] = 0
 
         if self.barrier is not None:
             self.barrier.wait()
@@ -1754,6 +1809,21 @@ def get_voltage_range(v_max):
     return v_range
 
 
+def mean_power(data, points=None):
+    """Calculates the mean power of data.
+
+    :param data: List of data with voltage and current fields.
+    :param points: Number of final data points to average,
+        or None to average all data.
+        [Default: None]
+    :returns: Mean power.
+    """
+    start = 0 if points is None else len(data) - points
+    return statistics.fmean(
+        datum.voltage * datum.current for datum in itertools.islice(data, start, None)
+    )
+
+
 LimitConfig = namedtuple("LimitConfig", ["config_int", "value"])
 
 
@@ -4,7 +4,6 @@ import json
 
 # import pkg_resources
 import importlib.resources
-from glob import glob
 
 
 def technique_directory(version=None):
@@ -42,13 +41,14 @@ def default_techniques_version():
         techniques_dir = os.path.normpath(
             os.path.join(__file__, "..", "..", "techniques")
         )
-        tech_dirs = [dir for dir in os.listdir(techniques_dir) if os.path.isdir(dir)]
+        with os.scandir(techniques_dir) as entries:
+            tech_dirs = [entry.name for entry in entries if entry.is_dir()]
 
         # parse versions
         version_pattern = "([\d\.]+)"
         versions = []
         for dir in tech_dirs:
-            match = re.match(version_pattern, os.path.basename(dir))
+            match = re.match(version_pattern, dir)
             if match is None:
                 # error in matching
                 # all directories should match pattern
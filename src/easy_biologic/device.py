@@ -1,11 +1,26 @@
+import time
 import asyncio
 import ctypes as c
+import functools
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from .lib.ec_errors import EcError
-from .lib import ec_find as ecf
 from .lib import ec_lib as ecl
 
+# bind channel calls once, they are used in polling loops
+_channel_info = ecl.channel_info
+_start_channel = ecl.start_channel
+_start_channels = ecl.start_channels
+_stop_channel = ecl.stop_channel
+_stop_channels = ecl.stop_channels
+_get_values = ecl.get_values
+_get_data = ecl.get_data
+_get_data_async = ecl.get_data_async
+
+# Seconds a probed connection state is reused for.
+CONNECTION_PROBE_INTERVAL = 0.5
+
 HardwareConfiguration = namedtuple(
     "HardwareConfiguration",
     ["connection", "mode"],  # electrode connection  # channel mode
@@ -15,7 +30,17 @@ HardwareConfiguration = namedtuple(
 TechParams = namedtuple("TechParams", ["technique", "parameters"])
 
 
-TechData = namedtuple("TechData", ["data", "info", "values"])
+TechData = ecl.TechData
+
+
+def _channel_field(infos, field):
+    """
+    :param infos: List of ChannelInfo, or None for unavailable channels.
+    :param field: Name of the ChannelInfo field.
+    :returns: Tuple of the field's value for each channel,
+        or None if the channel is not available.
+    """
+    return tuple(None if info is None else getattr(info, field) for info in infos)
 
 
 class BiologicDevice:
@@ -33,12 +58,21 @@ class BiologicDevice:
         self.__init_variables()
 
         self.__info = None
+        self.__kind = None  # resolved from info on first use
+        self.__executor = None  # worker threads for channel queries
         if populate_info:
             self.populate_info()
 
     def __del__(self):
-        if self.is_connected():
-            self.disconnect()
+        # best effort, without probing the connection during teardown
+        try:
+            if self.__idn is not None:
+                ecl.disconnect(self.__idn)
+
+            self.__shutdown_executor()
+
+        except Exception:
+            pass
 
     # --- properties ---
 
@@ -68,7 +102,10 @@ class BiologicDevice:
                 "Device must have been connected before retrieving info."
             )
 
-        return ecl.DeviceCodes(self.info.DeviceCode)
+        if self.__kind is None:
+            self.__kind = ecl.DeviceCodes(self.info.DeviceCode)
+
+        return self.__kind
 
     @property
     def info(self):
@@ -87,14 +124,24 @@ class BiologicDevice:
     @property
     def channels(self):
         """
-        :returns: List of ChannelInfo objects.
+        Queries the device on each access, as channel states change.
+
+        :returns: List of ChannelInfo objects, or None if the channel is not available.
         """
         self._validate_connection()
 
-        return [
-            ecl.channel_info(self.idn, ch) if available else None
-            for ch, available in enumerate(self.plugged)
-        ]
+        # query available channels concurrently on the device worker threads,
+        # ctypes releases the GIL
+        available_chs = [ch for ch, available in enumerate(self.plugged) if available]
+        if not available_chs:
+            return [None] * len(self.plugged)
+
+        infos = self.__executor.map(
+            functools.partial(_channel_info, self.idn), available_chs
+        )
+        infos = dict(zip(available_chs, infos))
+
+        return [infos.get(ch) for ch in range(len(self.plugged))]
 
     @property
     def hardware_configuration(self):
@@ -122,6 +169,22 @@ class BiologicDevice:
         """
         return self.__techniques
 
+    @property
+    def channel_firmware_versions(self):
+        """
+        :returns: Tuple of the firmware version of each channel,
+            or None if the channel is not available.
+        """
+        return self.__channel_firmware_versions
+
+    @property
+    def channel_amp_codes(self):
+        """
+        :returns: Tuple of the amplifier code of each channel,
+            or None if the channel is not available.
+        """
+        return self.__channel_amp_codes
+
     # --- methods ---
 
     def connect(self, bin_file=None, xlx_file=None):
@@ -139,6 +202,13 @@ class BiologicDevice:
 
         self.__idn = idn
         self.__info = info
+        self.__all_channels = tuple(range(info.NumberOfChannels))
+        self.__kind = None
+        self.__connected = True
+        self.__last_probe = time.monotonic()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=info.NumberOfChannels, thread_name_prefix=f"biologic-{idn}"
+        )
 
         # initialize only connected channels
         chs = []
@@ -151,36 +221,62 @@ class BiologicDevice:
             ecl.init_channels(self.idn, chs, bin_file=bin_file, xlx_file=xlx_file)
 
         except EcError as err:
-            if err.value == -9:
-                # ECLab firmware loaded
-                pass
+            if err.value != -9:
+                # only an already loaded ECLab firmware is expected
+                raise
 
         self.__techniques = [list() for ch in self.plugged]
 
+        # store fixed channel properties
+        infos = self.channels
+        self.__channel_firmware_versions = _channel_field(infos, "FirmwareVersion")
+        self.__channel_amp_codes = _channel_field(infos, "AmpCode")
+
     def disconnect(self):
         """Disconnect from the device."""
         self._validate_connection()
         ecl.disconnect(self.idn)
         self.__init_variables()  # reset vairables
+        self.__shutdown_executor()
 
     def populate_info(self):
-        """Connects then disconnects from the device in order to populate info."""
-        self.connect()
-        self.disconnect()
+        """Connects then disconnects from the device in order to populate info.
+        Channels are not initialized.
+        """
+        if self.idn is not None:
+            raise RuntimeError("Device already connected.")
+
+        (idn, self.__info) = ecl.connect(self.address, self.timeout)
+        self.__kind = None
+        ecl.disconnect(idn)
 
-    def is_connected(self):
+    def is_connected(self, cached=False):
         """Returns if the device is conencted or not.
+        The connection is only tested if it was not tested in the last
+        CONNECTION_PROBE_INTERVAL seconds.
 
+        :param cached: Use the last known connection state, only testing the
+            connection if it is unknown.
+            [Default: False]
         :returns: Boolean descirbing the state of connection.
         """
         if self.idn is None:
             return False
 
+        if cached and self.__connected:
+            return True
+
+        if time.monotonic() - self.__last_probe < CONNECTION_PROBE_INTERVAL:
+            return self.__connected
+
         connected = ecl.is_connected(self.idn)
+        self.__connected = connected
+        self.__last_probe = time.monotonic()
 
         # update state
         if not connected:
             self.__init_variables()
+            self.__shutdown_executor()
 
         elif self.idn is None:
             # connected but id is None
@@ -243,8 +339,17 @@ class BiologicDevice:
 
         ecl.load_technique(self.idn, ch, technique, ecc_params, first, last)
 
-        # update technques
-        self.__techniques[ch].insert(index, TechParams(technique, params))
+        # update technques, the first technique starts a new sequence
+        if first:
+            self.__techniques[ch] = []
+
+        techniques = self.__techniques[ch]
+        tech_params = TechParams(technique, params)
+        if index >= len(techniques):
+            techniques.append(tech_params)
+
+        else:
+            techniques.insert(index, tech_params)
 
     def load_techniques(self, ch, techniques, parameters, types=None):
         """Loads a series of techniques on to the given channel.
@@ -259,20 +364,31 @@ class BiologicDevice:
         """
         self._validate_connection()
 
-        for index, technique in enumerate(techniques):
-            params = parameters[index]
-            last = index == len(techniques) - 1
+        if types is None:
+            types = [None] * len(techniques)
 
-            if isinstance(types, list):
-                kinds = types[index]
+        elif not isinstance(types, list):
+            raise TypeError("Invalid types provided.")
 
-            elif types is None:
-                kinds = None
+        # prepare all techniques before loading
+        kind = self.kind
+        technique_files = [ecl.technique_file(tech, kind) for tech in techniques]
+        parameters = [
+            params if (kinds is None) else ecl.cast_parameters(params, kinds)
+            for params, kinds in zip(parameters, types)
+        ]
+        ecc_params = [
+            ecl.create_parameters(params, index)
+            for index, params in enumerate(parameters)
+        ]
 
-            else:
-                raise TypeError("Invalid types provided.")
+        ecl.load_techniques(self.idn, ch, technique_files, ecc_params)
 
-            self.load_technique(ch, technique, params, index, last, kinds)
+        # update techniques, loading replaces the channel's sequence
+        self.__techniques[ch] = [
+            TechParams(technique, params)
+            for technique, params in zip(technique_files, parameters)
+        ]
 
     def update_parameters(self, ch, technique, parameters, index=0, types=None):
         """Updates technique parameters.
@@ -287,7 +403,19 @@ class BiologicDevice:
         """
         self._validate_connection()
 
-        ecc_params = ecl.create_parameters(parameters, index, types)
+        # reuse the parameter list of previous updates if its size matches
+        ecc_params = self.__ecc_params.get((ch, index))
+        if ecc_params is not None:
+            try:
+                ecl.fill_parameters(ecc_params, parameters, index, types)
+
+            except ValueError:
+                # number of parameters changed
+                ecc_params = None
+
+        if ecc_params is None:
+            ecc_params = ecl.create_parameters(parameters, index, types)
+            self.__ecc_params[(ch, index)] = ecc_params
 
         ecl.update_parameters(self.idn, ch, technique, ecc_params, index, self.kind)
 
@@ -300,7 +428,7 @@ class BiologicDevice:
         :param ch: Channel to start.
         """
         self._validate_connection()
-        ecl.start_channel(self.idn, ch)
+        _start_channel(self.idn, ch)
 
     def start_channels(self, chs=None):
         """Starts multiple channels.
@@ -311,9 +439,9 @@ class BiologicDevice:
         self._validate_connection()
         if chs is None:
             # start all channels
-            chs = list(range(self.info.NumberOfChannels))
+            chs = self.__all_channels
 
-        ecl.start_channels(self.idn, chs)
+        _start_channels(self.idn, chs)
 
     def stop_channel(self, ch):
         """Stops a device channel.
@@ -321,7 +449,7 @@ class BiologicDevice:
         :param ch: Channel to stop.
         """
         self._validate_connection()
-        ecl.stop_channel(self.idn, ch)
+        _stop_channel(self.idn, ch)
 
     def stop_channels(self, chs=None):
         """Stops multiple channels.
@@ -332,9 +460,9 @@ class BiologicDevice:
         self._validate_connection()
         if chs is None:
             # stop all channels
-            chs = list(range(self.info.NumberOfChannels))
+            chs = self.__all_channels
 
-        ecl.stop_channels(self.idn, chs)
+        _stop_channels(self.idn, chs)
 
     def channel_info(self, ch):
         """Gets channel info.
@@ -344,18 +472,20 @@ class BiologicDevice:
         """
         self._validate_connection()
 
-        info = ecl.channel_info(self.idn, ch)
+        info = _channel_info(self.idn, ch)
         return info
 
-    def get_values(self, ch):
+    def get_values(self, ch, values=None):
         """Gets the current data on the channel.
 
         :param ch: Channel.
+        :param values: CurrentValues object to fill, or None to create a new one.
+            [Default: None]
         :returns: A dictionary of key-value pairs.
         """
         self._validate_connection()
 
-        values = ecl.get_values(self.idn, ch)
+        values = _get_values(self.idn, ch, values)
         return values
 
     async def get_data(self, ch):
@@ -366,8 +496,7 @@ class BiologicDevice:
         """
         self._validate_connection()
 
-        raw = await ecl.get_data_async(self.idn, ch)
-        return TechData(*raw)
+        return await _get_data_async(self.idn, ch)
 
     def _validate_connection(self):
         """
@@ -379,21 +508,34 @@ class BiologicDevice:
 
         return True
 
+    def __shutdown_executor(self):
+        """Releases the worker threads, if any."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
     def __init_variables(self):
         """Initializes instance variables."""
         self.__idn = None  # device identifier
         self.__plugged = None  # list of plugged in channels
         self.__techniques = None  # list of channel techniques
+        self.__ecc_params = {}  # parameter lists by channel and index
+        self.__connected = False  # last known connection state
+        self.__channel_firmware_versions = None  # per channel, set on connect
+        self.__channel_amp_codes = None  # per channel, set on connect
+        self.__last_probe = 0.0  # time the connection was last tested
+        self.__all_channels = None  # indices of all device channels
 
 
 class BiologicDeviceAsync:
     """Represents a Biologic Device."""
 
-    async def __init__(self, address, timeout=5, populate_info=True):
+    def __init__(self, address, timeout=5):
         """
+        Use #create to also populate the device info.
+
         :param address: The address of the device to connect to.
         :param timeout: Timeout in seconds. [Defualt: 5]
-        :param populate_info: Run an initial #populate_info. [Default: True]
         """
         self.__address = address
         self.timeout = timeout
@@ -401,12 +543,34 @@ class BiologicDeviceAsync:
         self.__init_variables()
 
         self.__info = None
+        self.__kind = None  # resolved from info on first use
+        self.__executor = None  # worker threads for blocking library calls
+
+    @classmethod
+    async def create(cls, address, timeout=5, populate_info=True):
+        """Creates a device.
+
+        :param address: The address of the device to connect to.
+        :param timeout: Timeout in seconds. [Defualt: 5]
+        :param populate_info: Run an initial #populate_info. [Default: True]
+        :returns: BiologicDeviceAsync.
+        """
+        device = cls(address, timeout)
         if populate_info:
-            await self.populate_info()
+            await device.populate_info()
+
+        return device
 
     def __del__(self):
-        if self.is_connected():
-            self.disconnect()
+        # best effort, without probing the connection during teardown
+        try:
+            if self.__idn is not None:
+                ecl.disconnect(self.__idn)
+
+            self.__shutdown_executor()
+
+        except Exception:
+            pass
 
     @property
     def address(self):
@@ -434,7 +598,10 @@ class BiologicDeviceAsync:
                 "Device must have been connected before retrieving info."
             )
 
-        return ecl.DeviceCodes(self.info.DeviceCode)
+        if self.__kind is None:
+            self.__kind = ecl.DeviceCodes(self.info.DeviceCode)
+
+        return self.__kind
 
     @property
     def info(self):
@@ -453,12 +620,15 @@ class BiologicDeviceAsync:
     @property
     def channels(self):
         """
-        :returns: List of ChannelInfo objects.
+        Queries the device on each access, blocking while it does.
+        Use #channel_infos to query without blocking the event loop.
+
+        :returns: List of ChannelInfo objects, or None if the channel is not available.
         """
         self._validate_connection()
 
         return [
-            ecl.channel_info(self.idn, ch) if available else None
+            _channel_info(self.idn, ch) if available else None
             for ch, available in enumerate(self.plugged)
         ]
 
@@ -500,6 +670,22 @@ class BiologicDeviceAsync:
         """
         return self.__techniques
 
+    @property
+    def channel_firmware_versions(self):
+        """
+        :returns: Tuple of the firmware version of each channel,
+            or None if the channel is not available.
+        """
+        return self.__channel_firmware_versions
+
+    @property
+    def channel_amp_codes(self):
+        """
+        :returns: Tuple of the amplifier code of each channel,
+            or None if the channel is not available.
+        """
+        return self.__channel_amp_codes
+
     async def connect(self, bin_file=None, xlx_file=None):
         """Connects to the device at the address. Checks channel status.
 
@@ -511,53 +697,92 @@ class BiologicDeviceAsync:
         if self.idn is not None:
             raise RuntimeError("Device already connected.")
 
-        (idn, info) = await ecl.connect_async(self.address, self.timeout)
+        (idn, info) = await self._run(ecl.connect, self.address, self.timeout)
 
         self.__idn = idn
         self.__info = info
+        self.__all_channels = tuple(range(info.NumberOfChannels))
+        self.__kind = None
+        self.__connected = True
+        self.__last_probe = time.monotonic()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=info.NumberOfChannels, thread_name_prefix=f"biologic-{idn}"
+        )
 
         # initialize only connected channels
         chs = []
-        self.__plugged = ecl.get_channels_async(self.idn)
+        self.__plugged = await self._run(ecl.get_channels, self.idn)
         for i in range(len(self.plugged)):
             if self.plugged[i]:
                 chs.append(i)
 
         try:
-            await ecl.init_channels_async(
-                self.idn, chs, bin_file=bin_file, xlx_file=xlx_file
+            await self._run(
+                functools.partial(
+                    ecl.init_channels,
+                    self.idn,
+                    chs,
+                    bin_file=bin_file,
+                    xlx_file=xlx_file,
+                )
             )
         except EcError as err:
-            if err.value == -9:
-                # ECLab firmware loaded
-                pass
+            if err.value != -9:
+                # only an already loaded ECLab firmware is expected
+                raise
 
         self.__techniques = [list() for ch in self.plugged]
 
+        # store fixed channel properties
+        infos = await self.channel_infos()
+        self.__channel_firmware_versions = _channel_field(infos, "FirmwareVersion")
+        self.__channel_amp_codes = _channel_field(infos, "AmpCode")
+
     async def disconnect(self):
         """Disconnect form the device."""
         self._validate_connection()
-        await ecl.disconnect_async(self.idn)
+        await self._run(ecl.disconnect, self.idn)
         self.__init_variables()  # reset vairables
+        self.__shutdown_executor()
 
     async def populate_info(self):
-        """Connects then disconnects from the device in order to populate info."""
-        await self.connect()
-        await self.disconnect()
+        """Connects then disconnects from the device in order to populate info.
+        Channels are not initialized.
+        """
+        if self.idn is not None:
+            raise RuntimeError("Device already connected.")
+
+        (idn, self.__info) = await self._run(ecl.connect, self.address, self.timeout)
+        self.__kind = None
+        await self._run(ecl.disconnect, idn)
 
-    async def is_connected(self):
+    async def is_connected(self, cached=False):
         """Returns if the device is conencted or not.
+        The connection is only tested if it was not tested in the last
+        CONNECTION_PROBE_INTERVAL seconds.
 
+        :param cached: Use the last known connection state, only testing the
+            connection if it is unknown.
+            [Default: False]
         :returns: Boolean descirbing the state of connection.
         """
         if self.idn is None:
             return False
 
-        connected = await ecl.is_connected_async(self.idn)
+        if cached and self.__connected:
+            return True
+
+        if time.monotonic() - self.__last_probe < CONNECTION_PROBE_INTERVAL:
+            return self.__connected
+
+        connected = await self._run(ecl.is_connected, self.idn)
+        self.__connected = connected
+        self.__last_probe = time.monotonic()
 
         # update state
         if not connected:
             self.__init_variables()
+            self.__shutdown_executor()
 
         elif self.idn is None:
             # connected but id is None
@@ -575,7 +800,7 @@ class BiologicDeviceAsync:
         if not self.plugged[ch]:
             return None
 
-        conf = await ecl.get_hardware_configuration_async(self.idn, ch)
+        conf = await self._run(ecl.get_hardware_configuration, self.idn, ch)
         return HardwareConfiguration(
             connection=ecl.ElectrodeConnection(conf.Conn),
             mode=ecl.ChannelMode(conf.Ground),
@@ -595,7 +820,7 @@ class BiologicDeviceAsync:
                 "Hardware configuration is only available for SP-300 devices."
             )
 
-        await ecl.set_hardware_configuration_async(self.idn, ch, mode, connection)
+        await self._run(ecl.set_hardware_configuration, self.idn, ch, mode, connection)
 
     async def load_technique(
         self, ch, technique, params, index=0, last=True, types=None
@@ -615,15 +840,26 @@ class BiologicDeviceAsync:
         first = index == 0
 
         if types is not None:
-            params = await ecl.cast_parameters_async(params, types)
+            params = ecl.cast_parameters(params, types)
 
         ecc_params = ecl.create_parameters(params, index)
         technique = ecl.technique_file(technique, self.kind)
 
-        await ecl.load_technique_async(self.idn, ch, technique, ecc_params, first, last)
+        await self._run(
+            ecl.load_technique, self.idn, ch, technique, ecc_params, first, last
+        )
+
+        # update technques, the first technique starts a new sequence
+        if first:
+            self.__techniques[ch] = []
+
+        techniques = self.__techniques[ch]
+        tech_params = TechParams(technique, params)
+        if index >= len(techniques):
+            techniques.append(tech_params)
 
-        # update technques
-        self.__techniques[ch].insert(index, TechParams(technique, params))
+        else:
+            techniques.insert(index, tech_params)
 
     async def load_techniques(self, ch, techniques, parameters, types=None):
         """Loads a series of techniques on to the given channel.
@@ -638,20 +874,31 @@ class BiologicDeviceAsync:
         """
         self._validate_connection()
 
-        for index, technique in enumerate(techniques):
-            params = parameters[index]
-            last = index == len(techniques) - 1
+        if types is None:
+            types = [None] * len(techniques)
 
-            if isinstance(types, list):
-                kinds = types[index]
+        elif not isinstance(types, list):
+            raise TypeError("Invalid types provided.")
 
-            elif types is None:
-                kinds = None
+        # prepare all techniques before loading
+        kind = self.kind
+        technique_files = [ecl.technique_file(tech, kind) for tech in techniques]
+        parameters = [
+            params if (kinds is None) else ecl.cast_parameters(params, kinds)
+            for params, kinds in zip(parameters, types)
+        ]
+        ecc_params = [
+            ecl.create_parameters(params, index)
+            for index, params in enumerate(parameters)
+        ]
 
-            else:
-                raise TypeError("Invalid types provided.")
+        await self._run(ecl.load_techniques, self.idn, ch, technique_files, ecc_params)
 
-            await self.load_technique(ch, technique, params, index, last, kinds)
+        # update techniques, loading replaces the channel's sequence
+        self.__techniques[ch] = [
+            TechParams(technique, params)
+            for technique, params in zip(technique_files, parameters)
+        ]
 
     async def update_parameters(self, ch, technique, parameters, index=0, types=None):
         """Updates technique parameters.
@@ -666,14 +913,39 @@ class BiologicDeviceAsync:
         """
         self._validate_connection()
 
-        ecc_params = await ecl.create_parameters_async(parameters, index, types)
-
-        await ecl.update_parameters_async(
-            self.idn, ch, technique, ecc_params, index, self.kind
-        )
+        # serialize updates of a technique,
+        # so its parameter list is not refilled while the library reads it
+        lock = self.__ecc_locks.get((ch, index))
+        if lock is None:
+            lock = self.__ecc_locks[(ch, index)] = asyncio.Lock()
+
+        async with lock:
+            # reuse the parameter list of previous updates if its size matches
+            ecc_params = self.__ecc_params.get((ch, index))
+            if ecc_params is not None:
+                try:
+                    ecl.fill_parameters(ecc_params, parameters, index, types)
+
+                except ValueError:
+                    # number of parameters changed
+                    ecc_params = None
+
+            if ecc_params is None:
+                ecc_params = ecl.create_parameters(parameters, index, types)
+                self.__ecc_params[(ch, index)] = ecc_params
+
+            await self._run(
+                ecl.update_parameters,
+                self.idn,
+                ch,
+                technique,
+                ecc_params,
+                index,
+                self.kind,
+            )
 
-        # update techniques
-        self.__techniques[ch][index] = TechParams(technique, parameters)
+            # update techniques
+            self.__techniques[ch][index] = TechParams(technique, parameters)
 
     async def start_channel(self, ch):
         """Starts a device channel.
@@ -681,7 +953,7 @@ class BiologicDeviceAsync:
         :param ch: Channel to start.
         """
         self._validate_connection()
-        await ecl.start_channel_async(self.idn, ch)
+        await self._run(_start_channel, self.idn, ch)
 
     async def start_channels(self, chs=None):
         """Starts multiple channels.
@@ -693,9 +965,9 @@ class BiologicDeviceAsync:
 
         if chs is None:
             # start all channels
-            chs = list(range(self.info.NumberOfChannels))
+            chs = self.__all_channels
 
-        await ecl.start_channels_async(self.idn, chs)
+        await self._run(_start_channels, self.idn, chs)
 
     async def stop_channel(self, ch):
         """Stops a device channel.
@@ -703,7 +975,7 @@ class BiologicDeviceAsync:
         :param ch: Channel to stop.
         """
         self._validate_connection()
-        await ecl.stop_channel_async(self.idn, ch)
+        await self._run(_stop_channel, self.idn, ch)
 
     async def stop_channels(self, chs=None):
         """Stops multiple channels.
@@ -714,9 +986,25 @@ class BiologicDeviceAsync:
         self._validate_connection()
         if chs is None:
             # stop all channels
-            chs = list(range(self.info.NumberOfChannels))
+            chs = self.__all_channels
+
+        await self._run(_stop_channels, self.idn, chs)
 
-        await ecl.stop_channels_async(self.idn, chs)
+    async def channel_infos(self):
+        """
+        Queries all channels concurrently, as channel states change.
+
+        :returns: List of ChannelInfo objects, or None if the channel is not available.
+        """
+        self._validate_connection()
+
+        available_chs = [ch for ch, available in enumerate(self.plugged) if available]
+        infos = await asyncio.gather(
+            *(self._run(_channel_info, self.idn, ch) for ch in available_chs)
+        )
+        infos = dict(zip(available_chs, infos))
+
+        return [infos.get(ch) for ch in range(len(self.plugged))]
 
     async def channel_info(self, ch):
         """Gets channel info.
@@ -726,18 +1014,20 @@ class BiologicDeviceAsync:
         """
         self._validate_connection()
 
-        info = await ecl.channel_info_async(self.idn, ch)
+        info = await self._run(_channel_info, self.idn, ch)
         return info
 
-    async def get_values(self, ch):
+    async def get_values(self, ch, values=None):
         """Gets the current data on the channel.
 
         :param ch: Channel.
+        :param values: CurrentValues object to fill, or None to create a new one.
+            [Default: None]
         :returns: A dictionary of key-value pairs.
         """
         self._validate_connection()
 
-        values = await ecl.get_values_async(self.idn, ch)
+        values = await self._run(_get_values, self.idn, ch, values)
         return values
 
     async def get_data(self, ch):
@@ -748,8 +1038,7 @@ class BiologicDeviceAsync:
         """
         self._validate_connection()
 
-        (data, info, values) = await ecl.get_data_async(self.idn, ch)
-        return TechData(data, info, values)
+        return await self._run(_get_data, self.idn, ch)
 
     # --- private methods ---
 
@@ -763,8 +1052,31 @@ class BiologicDeviceAsync:
 
         return True
 
+    async def _run(self, fn, *args):
+        """Runs a blocking library call on the device's worker threads.
+
+        :param fn: Function to run.
+        :param *args: Arguments to pass to the function.
+        :returns: Result of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, fn, *args)
+
+    def __shutdown_executor(self):
+        """Releases the worker threads, if any."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
     def __init_variables(self):
         """Initializes instance variables."""
         self.__idn = None  # device identifier
         self.__plugged = None  # list of plugged in channels
         self.__techniques = None  # list of channel techniques
+        self.__ecc_params = {}  # parameter lists by channel and index
+        self.__ecc_locks = {}  # update locks by channel and index
+        self.__connected = False  # last known connection state
+        self.__channel_firmware_versions = None  # per channel, set on connect
+        self.__channel_amp_codes = None  # per channel, set on connect
+        self.__last_probe = 0.0  # time the connection was last tested
+        self.__all_channels = None  # indices of all device channels
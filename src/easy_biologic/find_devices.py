@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import sys
 import argparse
 
 from .lib import ec_find as ecf
@@ -28,10 +29,11 @@ def run():
 
     # find and display devices
     devs = ecf.find_devices(args.conn)
-    for device in devs:
-        desc = "{}: {}".format(device.kind, device.connection_string)
+    descs = [
+        "{}: {}\n".format(device.kind, device.connection_string) for device in devs
+    ]
 
-        print(desc)
+    sys.stdout.write("".join(descs))
 
 
 if __name__ == "__main__":
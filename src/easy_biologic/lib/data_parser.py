@@ -1,4 +1,6 @@
 import math
+import ctypes as c
+import functools
 from collections import namedtuple
 
 from . import ec_lib as ecl
@@ -26,11 +28,8 @@ def parse(data, info, fields=None, device=None):
 
     if fields is None:
         # get fields from device
-        fields = (
-            SP300_Fields[technique]
-            if ecl.is_in_SP300_family(device.kind)
-            else VMP3_Fields[technique]
-        )
+        family = SP300_FIELDS if ecl.is_in_SP300_family(device.kind) else VMP3_FIELDS
+        fields = family[technique]
 
     if isinstance(fields, tuple):
         fields = fields[info.ProcessIndex]
@@ -39,25 +38,38 @@ def parse(data, info, fields=None, device=None):
         raise RuntimeError("No columns in data.")
 
     # technique info
-    field_names = [field.name for field in fields]
-    Datum = namedtuple("Datum", field_names)
-
-    # convert singles
-    data = [
-        (
-            ecl.convert_numeric(datum)
-            if (fields[index % cols].type is ecl.ParameterType.SINGLE)
-            else datum
-        )
-        for index, datum in enumerate(data)
+    Datum, singles = _datum_layout(tuple(fields))
+
+    # split data into columns, then group into rows
+    size = rows * cols
+    if not isinstance(data, c.Array):
+        # copy into a raw buffer once, so singles can be converted in bulk
+        data = (c.c_uint32 * size)(*data[:size])
+
+    # reinterpret the raw buffer as singles without copying
+    data_singles = (c.c_float * size).from_buffer(data)
+    columns = [
+        (data_singles if single else data)[col:size:cols]
+        for col, single in enumerate(singles)
     ]
 
-    # group data
-    parsed = [Datum(*data[i : i + cols]) for i in range(0, rows * cols, cols)]
-
+    parsed = list(map(Datum._make, zip(*columns)))
     return parsed
 
 
+@functools.lru_cache(maxsize=64)
+def _datum_layout(fields):
+    """
+    :param fields: Tuple of FieldInfo describing the data.
+    :returns: Tuple of ( Datum, singles ) where
+        Datum is a namedtuple class with the field names, and
+        singles is a tuple of whether each field is a single.
+    """
+    Datum = namedtuple("Datum", [field.name for field in fields])
+    singles = tuple(field.type is ecl.ParameterType.SINGLE for field in fields)
+    return (Datum, singles)
+
+
 def calculate_time(t_high, t_low, data_info, current_value):
     """
     Calculates time from the t_high and t_low fields.
@@ -77,6 +89,24 @@ def calculate_time(t_high, t_low, data_info, current_value):
     return start + elapsed
 
 
+def calculate_times(data, data_info, current_value):
+    """
+    Calculates times for all data points of a segment.
+
+    :param data: List of parsed data with t_high and t_low fields.
+    :param data_info: DataInfo object of the technique.
+    :param current_values: CurrentValues object of the technique.
+    :returns: List of times.
+    """
+    start = data_info.StartTime
+    if math.isnan(start):
+        # start is not a number, assume 0
+        start = 0
+
+    time_base = current_value.TimeBase
+    return [start + time_base * ((datum.t_high << 32) + datum.t_low) for datum in data]
+
+
 # For holding field info.
 FieldInfo = namedtuple("FieldInfo", ["name", "type"])
 
@@ -257,3 +287,26 @@ class SP300_Fields:
             FI("time", SINGLE),
         ],
     )
+
+
+# technique id to field definitions, for dispatch in parse
+# field lists are kept as is, tuples hold per process fields
+VMP3_FIELDS = {
+    ecl.TechniqueId.OCV: VMP3_Fields.OCV,
+    ecl.TechniqueId.CA: VMP3_Fields.CA,
+    ecl.TechniqueId.CP: VMP3_Fields.CP,
+    ecl.TechniqueId.CV: VMP3_Fields.CV,
+    ecl.TechniqueId.PEIS: VMP3_Fields.PEIS,
+    ecl.TechniqueId.GEIS: VMP3_Fields.GEIS,
+    ecl.TechniqueId.CALIMIT: VMP3_Fields.CALIMIT,
+}
+
+SP300_FIELDS = {
+    ecl.TechniqueId.OCV: SP300_Fields.OCV,
+    ecl.TechniqueId.CA: SP300_Fields.CA,
+    ecl.TechniqueId.CP: SP300_Fields.CP,
+    ecl.TechniqueId.CV: SP300_Fields.CV,
+    ecl.TechniqueId.PEIS: SP300_Fields.PEIS,
+    ecl.TechniqueId.GEIS: SP300_Fields.GEIS,
+    ecl.TechniqueId.CALIMIT: SP300_Fields.CALIMIT,
+}
@@ -76,6 +76,12 @@ class EcError(Exception):
         -405: ("ERR_TECH_MEMFULL", "Cannot load techniques: full memory."),
     }
 
+    # formatted error descriptions, by value
+    descriptions = {
+        value: f"{code} ({value}): {message}"
+        for value, (code, message) in errors.items()
+    }
+
     def __init__(self, value=None, code=None, message=None):
         """
         Creates an EcError.
@@ -87,17 +93,21 @@ class EcError(Exception):
         :param message: The error message.
         :returns: EcError
         """
-        if value is not None:
+        if value is None:
+            # no error value
+            out = ""
+
+        else:
             try:
-                (code, message) = EcError.errors[value]
+                out = EcError.descriptions[value]
 
-            except KeyError as err:
-                raise ValueError(f"Unknown error value {value}.")
+            except KeyError:
+                raise ValueError(f"Unknown error value {value}.") from None
 
-            out = f"{code} ({value}): {message}"
+            code, message = EcError.errors[value]
 
-        else:
-            # no error value
-            out = ""
+        self.value = value
+        self.code = code
+        self.message = message
 
         super(EcError, self).__init__(out)
@@ -1,8 +1,10 @@
 import os
+import time
 import logging
+import functools
+import threading
 import ctypes as c
 import platform
-import pkg_resources
 
 from .. import common
 
@@ -12,6 +14,19 @@ class Device:
     Represents a device.
     """
 
+    __slots__ = (
+        "connection",
+        "address",
+        "kind",
+        "sn",
+        "gateway",
+        "netmask",
+        "mac",
+        "idn",
+        "name",
+        "__connection_string",
+    )
+
     def __init__(
         self,
         connection,
@@ -53,43 +68,93 @@ class Device:
         self.idn = idn
         self.name = name
 
+        self.__connection_string = (
+            "USB{}".format(address) if (connection == "USB") else address
+        )
+
     @property
     def connection_string(self):
-        if self.connection == "USB":
-            return "USB{}".format(self.address)
+        return self.__connection_string
+
+
+# Return and argument types of each DLL function.
+FIND_ARGTYPES = [c.c_char_p, c.POINTER(c.c_uint32), c.POINTER(c.c_uint32)]
+DLL_FUNCTIONS = {
+    "BL_FindEChemDev": (c.c_int, FIND_ARGTYPES),
+    "BL_FindEChemEthDev": (c.c_int, FIND_ARGTYPES),
+    "BL_FindEChemUsbDev": (c.c_int, FIND_ARGTYPES),
+    "BL_SetConfig": (c.c_int, None),
+    "BL_GetErrorMsg": (None, None),
+}
+
+# Find function of each connection type.
+FIND_FUNCTIONS = {
+    None: "BL_FindEChemDev",
+    "usb": "BL_FindEChemUsbDev",
+    "eth": "BL_FindEChemEthDev",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load_dll():
+    """
+    Loads the find DLL on first use.
+
+    :returns: The loaded DLL.
+    """
+    arch = platform.architecture()
+    bits = arch[0]
+    bits = bits.replace("bit", "")
+    bits = int(bits)
+    logging.debug("[ec_find] Running on {}-bit platform.".format(bits))
+
+    bits = "" if (bits == 32) else "64"
+    dll_file = os.path.join(common.technique_directory(), "blfind{}.dll".format(bits))
+    return c.WinDLL(dll_file)
+
+
+@functools.lru_cache(maxsize=None)
+def dll_function(name):
+    """
+    Loads a DLL function, declaring its types.
 
-        else:
-            return self.address
+    :param name: Name of the function.
+    :returns: The DLL function.
+    """
+    restype, argtypes = DLL_FUNCTIONS[name]
+
+    func = load_dll()[name]
+    func.restype = restype
+    if argtypes is not None:
+        func.argtypes = argtypes
+
+    return func
 
 
-arch = platform.architecture()
-bits = arch[0]
-bits = bits.replace("bit", "")
-bits = int(bits)
-logging.debug("[ec_find] Running on {}-bit platform.".format(bits))
+def __getattr__(name):
+    """
+    Loads DLL functions when accessed as module attributes.
+    """
+    if name in DLL_FUNCTIONS:
+        return dll_function(name)
 
-bits = "" if (bits == 32) else "64"
-dll_file = os.path.join(common.technique_directory(), "blfind{}.dll".format(bits))
-__dll = c.WinDLL(dll_file)
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
 
-# load DLL functions
-BL_FindEChemDev = __dll["BL_FindEChemDev"]
-BL_FindEChemDev.restype = c.c_int
 
-BL_FindEChemEthDev = __dll["BL_FindEChemEthDev"]
-BL_FindEChemEthDev.restype = c.c_int
+# Number of descriptors in each device record returned by a search.
+DEVICE_FIELDS = 9
 
-BL_FindEChemUsbDev = __dll["BL_FindEChemUsbDev"]
-BL_FindEChemUsbDev.restype = c.c_int
+# Seconds found devices are reused for before searching again.
+FIND_CACHE_TTL = 2
 
-BL_SetConfig = __dll["BL_SetConfig"]
-BL_SetConfig.restype = c.c_int
+# Cache of ( time, devices ) of the last search of each find function.
+_find_cache = {}
 
-BL_GetErrorMsg = __dll["BL_GetErrorMsg"]
-BL_GetErrorMsg.restype = None
+# Per thread search buffers, see #search_buffer.
+_search = threading.local()
 
 
-def find_devices(connection=None):
+def find_devices(connection=None, use_cache=True):
     """
     Find connected devices.
 
@@ -97,87 +162,125 @@ def find_devices(connection=None):
         Values are [ None, 'usb', 'eth' ].
         None searches USB and ethernet,
         'usb' and 'eth' search only USB or ethernet, respectively.
+    :param use_cache: Reuse the devices found by a search
+        within the last FIND_CACHE_TTL seconds. [Default: True]
 
     :return: An array of Devices.
     """
-    buffer_len = 4096
-    idn = c.create_string_buffer(buffer_len)
-    size = c.c_uint32(buffer_len)
-    num = c.c_uint32()
-
-    if connection is None:
-        func = BL_FindEChemDev
-
-    elif connection == "usb":
-        func = BL_FindEChemUsbDev
+    try:
+        func_name = FIND_FUNCTIONS[connection]
 
-    elif connection == "eth":
-        func = BL_FindEChemEthDev
-
-    else:
+    except (KeyError, TypeError):
         # invalid connection type
         raise ValueError(
             "Invalid connection type {}. Must be None, 'usb', or 'eth'.".format(
                 connection
             )
-        )
+        ) from None
+
+    func = dll_function(func_name)
 
-    err = raise_exception(func(c.byref(idn), c.byref(size), c.byref(num)))
+    if use_cache:
+        cached = _find_cache.get(func)
+        if (cached is not None) and (time.monotonic() - cached[0] < FIND_CACHE_TTL):
+            return list(cached[1])
+
+    buffer_len = 4096
+    idn = search_buffer(buffer_len)
+    size = c.c_uint32(buffer_len)
+    num = c.c_uint32()
+
+    err = raise_exception(func(idn, size, num))
 
     if err is not True:
         # unknown error
         raise RuntimeError("Unknown error type {}.".format(err))
 
     # successful call
-    # idn is filled with every character null terminated
-    # so must remove evey other character
-    idn_len = range(len(idn))
+    # idn may be filled with every character null terminated,
+    # and is padded with nulls, as the buffer is zeroed.
+    # descriptors never contain nulls, so removing every null
+    # handles both layouts without testing which one was used
+    idn = idn.raw.translate(None, b"\x00")
 
-    # check if odd positions are null terminators
-    char_term = [(idn[i] == b"\x00") for i in idn_len if (i % 2 == 1)]
-
-    if all(char_term):
-        # all odd positions are null terminators, remove them
-        idn = idn[::2]
+    # devices are separated by %
+    ids = idn.split(b"%")
+    ids = ids[:-1]  # final element follows the last separator
 
-    idn = idn.decode("utf-8")
+    # split the raw bytes, only decoding descriptor values
+    # descriptors are separated by $
+    records = []
+    for idd in ids:
+        desc = idd.split(b"$")
+        if len(desc) < DEVICE_FIELDS:
+            # malformed record, skip it instead of hiding every device
+            logging.warning(
+                "[ec_find] Skipping malformed device record {}.".format(idd)
+            )
+            continue
 
-    # devices are separated by %
-    ids = idn.split("%")
-    ids = ids[:-1]  # final element is null padding
+        # ignore any trailing descriptors
+        records.append(
+            [None if (d == b"") else d.decode("utf-8") for d in desc[:DEVICE_FIELDS]]
+        )
 
     # create devices
-    dev_keys = [
-        "connection",
-        "address",
-        "gateway",
-        "netmask",
-        "mac",
-        "idn",
-        "kind",
-        "sn",
-        "name",
+    devices = [
+        Device(
+            connection,
+            address,
+            kind,
+            sn,
+            gateway=gateway,
+            netmask=netmask,
+            mac=mac,
+            idn=idn,
+            name=name,
+        )
+        for connection, address, gateway, netmask, mac, idn, kind, sn, name in records
     ]
 
-    devices = []
-    for idd in ids:
-        desc = idd.split("$")  # descriptors are separated by $
-        desc = [None if (d == "") else d for d in desc]
-        desc = dict(zip(dev_keys, desc))  # create dictionary of descriptors
+    _find_cache[func] = (time.monotonic(), devices)
+    return list(devices)
+
+
+def search_buffer(size):
+    """
+    Returns a zeroed string buffer that is reused by later searches
+    on the same thread.
+    The buffer is only valid until the next call with the same size.
+
+    :param size: Size of the buffer.
+    :returns: A zeroed string buffer.
+    """
+    buffers = getattr(_search, "buffers", None)
+    if buffers is None:
+        buffers = _search.buffers = {}
+
+    buf = buffers.get(size)
+    if buf is None:
+        buf = buffers[size] = c.create_string_buffer(size)
+
+    else:
+        c.memset(buf, 0, size)
+
+    return buf
 
-        connection = desc["connection"]
-        address = desc["address"]
-        kind = desc["kind"]
-        sn = desc["sn"]
 
-        del desc["connection"]
-        del desc["address"]
-        del desc["kind"]
-        del desc["sn"]
+def invalidate_find_cache():
+    """
+    Clears the cache of found devices,
+    so the next search queries the library.
+    """
+    _find_cache.clear()
 
-        devices.append(Device(connection, address, kind, sn, **desc))  # add new device
 
-    return devices
+# Exception type and message of each known error value.
+FIND_ERRORS = {
+    -1: (RuntimeError, "Unknown Error."),
+    -2: (TypeError, "Invalid parameter."),
+    -20: (RuntimeError, "Find failed."),
+}
 
 
 def raise_exception(err):
@@ -193,16 +296,9 @@ def raise_exception(err):
         # no error
         return True
 
-    elif err == -1:
-        # unknown error
-        raise RuntimeError("Unknown Error.")
-
-    elif err == -2:
-        # parameter error
-        raise TypeError("Invalid parameter.")
+    error = FIND_ERRORS.get(err)
+    if error is not None:
+        kind, message = error
+        raise kind(message)
 
-    elif err == -20:
-        raise RuntimeError("Find failed.")
-
-    else:
-        return err
+    return err
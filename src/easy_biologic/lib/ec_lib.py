@@ -3,9 +3,10 @@ import os
 import asyncio
 import ctypes as c
 import platform
-import typing
-import inspect
 import functools
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from .ec_errors import EcError
@@ -447,6 +448,17 @@ class DataInfo(c.Structure):
     ]
 
 
+# Data retrieved from a channel.
+TechData = namedtuple("TechData", ["data", "info", "values"])
+
+
+# Number of values in a data transfer buffer.
+DATA_BUFFER_SIZE = 1000
+
+# Per thread scratch arrays, see #scratch_array.
+_scratch = threading.local()
+
+
 VMP3_DEVICE_FAMILY = {
     DeviceCodes.KBIO_DEV_VMP2,
     DeviceCodes.KBIO_DEV_VMP3,
@@ -498,70 +510,129 @@ bits = "" if (bits == 32) else "64"
 dll_file = os.path.join(common.technique_directory(), "EClib{}.dll".format(bits))
 __dll = c.WinDLL(dll_file)
 
-# load DLL functions
+# load DLL functions, declaring argument types
 # hardware functions
 BL_Connect = __dll["BL_Connect"]
 BL_Connect.restype = c.c_int32
+BL_Connect.argtypes = [
+    c.c_char_p,
+    c.c_uint8,
+    c.POINTER(c.c_int32),
+    c.POINTER(DeviceInfo),
+]
 
 BL_Disconnect = __dll["BL_Disconnect"]
 BL_Disconnect.restype = c.c_int32
+BL_Disconnect.argtypes = [c.c_int32]
 
 BL_TestConnection = __dll["BL_TestConnection"]
 BL_TestConnection.restype = c.c_int32
+BL_TestConnection.argtypes = [c.c_int32]
 
 BL_LoadFirmware = __dll["BL_LoadFirmware"]
 BL_LoadFirmware.restype = c.c_int32
+BL_LoadFirmware.argtypes = [
+    c.c_int32,
+    c.POINTER(c.c_uint8),
+    c.POINTER(c.c_int32),
+    c.c_uint8,
+    c.c_bool,
+    c.c_bool,
+    c.c_char_p,
+    c.c_char_p,
+]
 
 BL_IsChannelPlugged = __dll["BL_IsChannelPlugged"]
 BL_IsChannelPlugged.restype = c.c_bool
+BL_IsChannelPlugged.argtypes = [c.c_int32, c.c_uint8]
 
 BL_GetChannelsPlugged = __dll["BL_GetChannelsPlugged"]
 BL_GetChannelsPlugged.restype = c.c_int32
+BL_GetChannelsPlugged.argtypes = [c.c_int32, c.POINTER(c.c_uint8), c.c_uint8]
 
 BL_GetChannelInfos = __dll["BL_GetChannelInfos"]
 BL_GetChannelInfos.restype = c.c_int32
+BL_GetChannelInfos.argtypes = [c.c_int32, c.c_uint8, c.POINTER(ChannelInfo)]
 
 BL_GetHardConf = __dll["BL_GetHardConf"]
 BL_GetHardConf.restype = c.c_int32
+BL_GetHardConf.argtypes = [c.c_int32, c.c_uint8, c.POINTER(HardwareConf)]
 
 BL_SetHardConf = __dll["BL_SetHardConf"]
 BL_SetHardConf.restype = c.c_int32
+BL_SetHardConf.argtypes = [c.c_int32, c.c_uint8, HardwareConf]
 
 BL_LoadTechnique = __dll["BL_LoadTechnique"]
 BL_LoadTechnique.restype = c.c_int32
+BL_LoadTechnique.argtypes = [
+    c.c_int32,
+    c.c_uint8,
+    c.c_char_p,
+    EccParams,
+    c.c_bool,
+    c.c_bool,
+    c.c_bool,
+]
 
 BL_DefineBoolParameter = __dll["BL_DefineBoolParameter"]
 BL_DefineBoolParameter.restype = c.c_int32
+BL_DefineBoolParameter.argtypes = [c.c_char_p, c.c_bool, c.c_int32, c.POINTER(EccParam)]
 
 BL_DefineSglParameter = __dll["BL_DefineSglParameter"]
 BL_DefineSglParameter.restype = c.c_int32
+BL_DefineSglParameter.argtypes = [c.c_char_p, c.c_float, c.c_int32, c.POINTER(EccParam)]
 
 BL_DefineIntParameter = __dll["BL_DefineIntParameter"]
 BL_DefineIntParameter.restype = c.c_int32
+BL_DefineIntParameter.argtypes = [c.c_char_p, c.c_int32, c.c_int32, c.POINTER(EccParam)]
 
 BL_UpdateParameters = __dll["BL_UpdateParameters"]
 BL_UpdateParameters.restype = c.c_int32
+BL_UpdateParameters.argtypes = [c.c_int32, c.c_uint8, c.c_int32, EccParams, c.c_char_p]
 
 BL_StartChannel = __dll["BL_StartChannel"]
 BL_StartChannel.restype = c.c_int32
+BL_StartChannel.argtypes = [c.c_int32, c.c_uint8]
 
 BL_StartChannels = __dll["BL_StartChannels"]
 BL_StartChannels.restype = c.c_int32
+BL_StartChannels.argtypes = [
+    c.c_int32,
+    c.POINTER(c.c_uint8),
+    c.POINTER(c.c_int32),
+    c.c_uint8,
+]
 
 BL_StopChannel = __dll["BL_StopChannel"]
 BL_StopChannel.restype = c.c_int32
+BL_StopChannel.argtypes = [c.c_int32, c.c_uint8]
 
 BL_StopChannels = __dll["BL_StopChannels"]
 BL_StopChannels.restype = c.c_int32
+BL_StopChannels.argtypes = [
+    c.c_int32,
+    c.POINTER(c.c_uint8),
+    c.POINTER(c.c_int32),
+    c.c_uint8,
+]
 
 BL_GetCurrentValues = __dll["BL_GetCurrentValues"]
 BL_GetCurrentValues.restype = c.c_int32
+BL_GetCurrentValues.argtypes = [c.c_int32, c.c_uint8, c.POINTER(CurrentValues)]
 
 BL_GetData = __dll["BL_GetData"]
 BL_GetData.restype = c.c_int32
+BL_GetData.argtypes = [
+    c.c_int32,
+    c.c_uint8,
+    c.POINTER(c.c_uint32),
+    c.POINTER(DataInfo),
+    c.POINTER(CurrentValues),
+]
 
 BL_ConvertNumericIntoSingle = __dll["BL_ConvertNumericIntoSingle"]
 BL_ConvertNumericIntoSingle.restype = c.c_int32
+BL_ConvertNumericIntoSingle.argtypes = [c.c_uint32, c.POINTER(c.c_float)]
 
 methods = [
     BL_Connect,
@@ -584,28 +655,45 @@ methods = [
 ]
 
 
-# To handle asyncio.coroutine removal in Python 3.11
-# Following suggestion from https://discuss.python.org/t/deprecation-of-asyncio-coroutine/4461/2
-def coroutine(fn: typing.Callable) -> typing.Callable:
-    if int(platform.python_version_tuple()[1]) <= 10:
-        return asyncio.coroutine(fn)
+# Executor running blocking library calls for the async functions.
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ec_lib")
+
 
-    if inspect.iscoroutinefunction(fn):
-        return fn
+def in_executor(fn):
+    """Wraps a blocking function to run in a worker thread when awaited,
+    so library calls do not block the event loop.
+
+    :param fn: Blocking function to wrap.
+    :returns: Coroutine function running fn in the executor.
+    """
 
     @functools.wraps(fn)
     async def _wrapper(*args, **kwargs):
-        return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _executor, functools.partial(fn, *args, **kwargs)
+        )
 
     return _wrapper
 
 
 for method in methods:
     async_name = method.__name__ + "_async"
-    globals()[async_name] = coroutine(method)
+    globals()[async_name] = in_executor(method)
+
 
+# Parameter kind of each value type.
+PARAMETER_KINDS = {bool: "bool", int: "int", float: "single"}
 
-def create_parameter(name, value, index=0, kind=None):
+# Definition function and ctypes type of each parameter kind.
+PARAMETER_DEFINITIONS = {
+    "bool": (BL_DefineBoolParameter, c.c_bool),
+    "int": (BL_DefineIntParameter, c.c_int32),
+    "single": (BL_DefineSglParameter, c.c_float),
+}
+
+
+def create_parameter(name, value, index=0, kind=None, param=None):
     """Factory to create an EccParam structure.
 
     :param name: Paramter name.
@@ -616,46 +704,43 @@ def create_parameter(name, value, index=0, kind=None):
     :param kind: The kind of parameter, or None to interpret from the value.
         Values are [ None, 'bool', 'int', 'single' ].
         [Default: None]
+    :param param: EccParam structure to write the parameter into,
+        or None to create a new one.
+        [Default: None]
     :returns: An EccParam structure.
     """
     if kind is None:
         # interpret kind from value
         val_kind = type(value)
-
-        if val_kind is bool:
-            kind = "bool"
-
-        elif val_kind is int:
-            kind = "int"
-
-        elif val_kind is float:
-            kind = "single"
-
-        else:
+        kind = PARAMETER_KINDS.get(val_kind)
+        if kind is None:
             raise TypeError("[ec_lib] Invalid value type {}.".format(val_kind))
 
-    if kind == "bool":
-        create = BL_DefineBoolParameter
-        value = c.c_bool(value)
-
-    elif kind == "int":
-        create = BL_DefineIntParameter
-        value = c.c_int32(value)
-
-    elif kind == "single":
-        create = BL_DefineSglParameter
-        value = c.c_float(value)
+    try:
+        create, c_kind = PARAMETER_DEFINITIONS[kind]
 
-    else:
-        raise ValueError("[ec_lib] Invalid kind {}.".format(kind))
+    except KeyError:
+        raise ValueError("[ec_lib] Invalid kind {}.".format(kind)) from None
 
-    name = name.encode("utf-8")
+    value = c_kind(value)
+    name = encode_parameter_name(name)
     index = c.c_int32(index)
-    param = EccParam()
+    if param is None:
+        param = EccParam()
+
     create(name, value, index, c.byref(param))
     return param
 
 
+@functools.lru_cache(maxsize=256)
+def encode_parameter_name(name):
+    """
+    :param name: Parameter name.
+    :returns: The name encoded for the library.
+    """
+    return name.encode("utf-8")
+
+
 def combine_parameters(params):
     """Creates an ECCParams list of parameters.
 
@@ -692,18 +777,74 @@ def create_parameters(params, index=0, types=None):
     if types is not None:
         params = cast_parameters(params, types)
 
-    param_list = []
+    # define parameters directly in the final array
+    ecc_params = allocate_parameters(count_parameters(params))
+    return fill_parameters(ecc_params, params, index)
+
+
+def count_parameters(params):
+    """
+    :param params: A dictionary of parameters, see #create_parameters.
+    :returns: Number of EccParam structures needed for the parameters.
+    """
+    return sum(
+        len(values) if isinstance(values, list) else 1 for values in params.values()
+    )
+
+
+def allocate_parameters(num_params):
+    """Creates an EccParams list of empty parameters.
+
+    :param num_params: Number of parameters.
+    :returns: EccParams structure.
+    """
+    param_list = (EccParam * num_params)()
+
+    params = EccParams()
+    params.len = c.c_int32(num_params)
+    params.pParams = c.cast(param_list, c.POINTER(EccParam))
+
+    return params
+
+
+def fill_parameters(ecc_params, params, index=0, types=None):
+    """Writes parameters into an existing EccParams list,
+    reusing its memory instead of creating a new one.
+
+    :param ecc_params: EccParams structure to fill.
+    :param params: A dictionary of parameters, see #create_parameters.
+    :param index: Starting index for the parameters. [Default: 0]
+    :param types: A dictionary or Enum mapping parameter keys to types for casting,
+        or None if type casting is not desired.
+        [Default: None]
+    :returns: The filled EccParams structure.
+    :raises ValueError: If the number of parameters differs from that of ecc_params.
+    """
+    # cast types if desired
+    if types is not None:
+        params = cast_parameters(params, types)
+
+    num_params = count_parameters(params)
+    if num_params != ecc_params.len:
+        raise ValueError(
+            "[ec_lib] Expected {} parameters, got {}.".format(
+                ecc_params.len, num_params
+            )
+        )
+
+    param_list = ecc_params.pParams
+    pos = 0
     for name, values in params.items():
         if not isinstance(values, list):
             # single value given, turn into list
             values = [values]
 
         for idx, value in enumerate(values):
-            # create parameter for each value
-            param = create_parameter(name, value, index + idx)
-            param_list.append(param)
+            # overwrite parameter for each value
+            create_parameter(name, value, index + idx, param=param_list[pos])
+            pos += 1
 
-    return combine_parameters(param_list)
+    return ecc_params
 
 
 def cast_parameters(parameters, types):
@@ -716,31 +857,29 @@ def cast_parameters(parameters, types):
     :returns: New dictionary of values cast to given types.
         If a key is not provided in the types, no change is made to the value.
     """
-    cast = {}
     if isinstance(types, dict):
         # dictionary passed
-        for key, value in parameters.items():
-            if key in types:
-                # type provided
-                kind = types[key]
-                if isinstance(value, list):
-                    value = [kind(val) for val in value]
-                else:
-                    value = kind(value)
-            cast[key] = value
-    elif issubclass(types, Enum):
-        # enum passed
-        for key, value in parameters.items():
-            if key in types.__members__:
-                kind = types[key].value
-                if isinstance(value, list):
-                    value = [kind(val) for val in value]
-                else:
-                    value = kind(parameters[key])
-            cast[key] = value
+        kinds = types
+
+    elif isinstance(types, type) and issubclass(types, Enum):
+        # enum passed, resolve member values once
+        kinds = {key: member.value for key, member in types.__members__.items()}
+
     else:
         raise TypeError("Invalid types provided.")
 
+    cast = {}
+    for key, value in parameters.items():
+        kind = kinds.get(key)
+        if kind is not None:
+            # type provided
+            if isinstance(value, list):
+                value = [kind(val) for val in value]
+            else:
+                value = kind(value)
+
+        cast[key] = value
+
     return cast
 
 
@@ -766,16 +905,16 @@ def connect(address, timeout=5):
     :returns: A tuple of ( id, info ), where id is the connection id,
         and info is a DeviceInfo structure.
     """
-    address = c.create_string_buffer(address.encode("utf-8"))
+    address = address.encode("utf-8")
     timeout = c.c_uint8(timeout)
     idn = c.c_int32()
     info = DeviceInfo()
 
-    logging.debug("[easy-biologic] Connecting to device {}.".format(address.value))
-    err = BL_Connect(c.byref(address), timeout, c.byref(idn), c.byref(info))
+    logging.debug("[easy-biologic] Connecting to device {}.".format(address))
+    err = BL_Connect(address, timeout, c.byref(idn), c.byref(info))
 
     validate(err)
-    logging.debug("[easy-biologic] Conneced to device {}.".format(address.value))
+    logging.debug("[easy-biologic] Conneced to device {}.".format(address))
 
     return (idn.value, info)
 
@@ -832,23 +971,15 @@ def init_channels(idn, chs, force_reload=False, bin_file=None, xlx_file=None):
     idn = c.c_int32(idn)
     show_gauge = c.c_bool(False)
 
-    bin_file = (
-        c.c_void_p()
-        if (bin_file is None)
-        else c.byref(c.create_string_buffer(bin_file.encode("utf-8")))
-    )
+    bin_file = None if (bin_file is None) else bin_file.encode("utf-8")
 
-    xlx_file = (
-        c.c_void_p()
-        if (xlx_file is None)
-        else c.byref(c.create_string_buffer(xlx_file.encode("utf-8")))
-    )
+    xlx_file = None if (xlx_file is None) else xlx_file.encode("utf-8")
 
     logging.debug(f"[easy-biologic] Initializing channels {chs} on device {idn.value}.")
     err = BL_LoadFirmware(
         idn,
-        c.byref(active),
-        c.byref(results),
+        active,
+        results,
         length,
         show_gauge,
         force_reload,
@@ -883,11 +1014,11 @@ def get_channels(idn, size=16):
     :return: A list of booleans indicating the plugged state of the channel.
     """
     idn = c.c_int32(idn)
-    channels = (c.c_uint8 * size)()
-    size = c.c_int32(size)
+    channels = scratch_array(c.c_uint8, size)
+    size = c.c_uint8(size)
 
     logging.debug("[easy-biologic] Getting channels for device {}.".format(idn.value))
-    err = BL_GetChannelsPlugged(idn, c.byref(channels), size)
+    err = BL_GetChannelsPlugged(idn, channels, size)
 
     validate(err)
     return [(ch == 1) for ch in channels]
@@ -995,7 +1126,7 @@ def load_technique(
     ch = c.c_uint8(ch)
 
     technique_path = technique_file(technique, device)
-    technique = c.create_string_buffer(technique_path.encode("utf-8"))
+    technique = technique_path.encode("utf-8")
 
     first = c.c_bool(first)
     last = c.c_bool(last)
@@ -1006,11 +1137,43 @@ def load_technique(
             ch.value, idn.value
         )
     )
-    err = BL_LoadTechnique(idn, ch, c.byref(technique), params, first, last, verbose)
+    err = BL_LoadTechnique(idn, ch, technique, params, first, last, verbose)
 
     validate(err)
 
 
+def load_techniques(idn, ch, techniques, params, device=None, verbose=False):
+    """Loads a sequence of techniques onto a specified device channel.
+
+    :param idn: Device id.
+    :param ch: Channel.
+    :param techniques: List of technique file names, in order.
+    :param params: List of EccParams structures, one for each technique.
+    :param device: Type of device. Used to modify techniques.
+        [Default: None]
+    :param verbose: Echoes the sent parameters for debugging. [Default: False]
+    """
+    idn = c.c_int32(idn)
+    ch = c.c_uint8(ch)
+    verbose = c.c_bool(verbose)
+    last_index = len(techniques) - 1
+
+    logging.debug(
+        "[easy-biologic] Loading {} techniques on channel {} on device {}.".format(
+            len(techniques), ch.value, idn.value
+        )
+    )
+    for index, (technique, tech_params) in enumerate(zip(techniques, params)):
+        technique_path = technique_file(technique, device)
+        technique = technique_path.encode("utf-8")
+
+        first = c.c_bool(index == 0)
+        last = c.c_bool(index == last_index)
+
+        err = BL_LoadTechnique(idn, ch, technique, tech_params, first, last, verbose)
+        validate(err)
+
+
 def update_parameters(idn, ch, technique, params, index=0, device=None):
     """Updates the parameters of a technique.
 
@@ -1027,7 +1190,7 @@ def update_parameters(idn, ch, technique, params, index=0, device=None):
     ch = c.c_uint8(ch)
 
     technique = technique_file(technique, device)
-    technique = c.create_string_buffer(technique.encode("utf-8"))
+    technique = technique.encode("utf-8")
     index = c.c_int32(index)
 
     logging.debug(
@@ -1035,7 +1198,7 @@ def update_parameters(idn, ch, technique, params, index=0, device=None):
             ch.value, idn.value
         )
     )
-    err = BL_UpdateParameters(idn, ch, index, params, c.byref(technique))
+    err = BL_UpdateParameters(idn, ch, index, params, technique)
 
     validate(err)
 
@@ -1064,14 +1227,14 @@ def start_channels(idn, chs):
     :param chs: List of channels to start.
     """
     num_chs = max(chs) + 1
-    results = (c.c_int32 * num_chs)()
-    active = create_active_array(chs, num_chs)
+    results = scratch_array(c.c_int32, num_chs)
+    active = create_active_array(chs, num_chs, reuse=True)
     idn = c.c_int32(idn)
 
     logging.debug(
         "[easy-biologic] Starting channels {} on device {}.".format(chs, idn.value)
     )
-    err = BL_StartChannels(idn, c.byref(active), c.byref(results), num_chs)
+    err = BL_StartChannels(idn, active, results, num_chs)
 
     validate(err)
 
@@ -1100,28 +1263,32 @@ def stop_channels(idn, chs):
     :param chs: List of channels to stop.
     """
     num_chs = max(chs) + 1
-    results = (c.c_int32 * num_chs)()
-    active = create_active_array(chs, num_chs)
+    results = scratch_array(c.c_int32, num_chs)
+    active = create_active_array(chs, num_chs, reuse=True)
     idn = c.c_int32(idn)
 
     logging.debug(
         "[easy-biologic] Stopping channels {} on device {}.".format(chs, idn.value)
     )
-    err = BL_StopChannels(idn, c.byref(active), c.byref(results), num_chs)
+    err = BL_StopChannels(idn, active, results, num_chs)
 
     validate(err)
 
 
-def get_values(idn, ch):
+def get_values(idn, ch, values=None):
     """Gets the current data values on the given device channel.
 
     :param idn: Device identifier.
     :param ch: Channel.
+    :param values: CurrentValues object to fill, or None to create a new one.
+        Reusing an object avoids an allocation when polling.
+        [Default: None]
     :returns: CurrentValues object.
     """
     idn = c.c_int32(idn)
     ch = c.c_uint8(ch)
-    values = CurrentValues()
+    if values is None:
+        values = CurrentValues()
 
     logging.debug(
         "[easy-biologic] Getting values of channel {} on device {}.".format(
@@ -1140,14 +1307,15 @@ def get_data(idn, ch):
 
     :param idn: Device identifier.
     :param ch: Channel.
-    :returns: A tuple of ( data, data_info, current_values ) where
-        data_info is a DataInfo object representing the data's metadata,
-        data is a data array, and
+    :returns: A TechData tuple of ( data, data_info, current_values ) where
+        data is an array of the retrieved raw data,
+        data_info is a DataInfo object representing the data's metadata, and
         current_values is a CurrentValues object.
     """
     idn = c.c_int32(idn)
     ch = c.c_uint8(ch)
-    data = (c.c_uint32 * 1000)()
+    # reuse the transfer buffer, only copying out the retrieved data
+    buf = scratch_array(c.c_uint32, DATA_BUFFER_SIZE)
     info = DataInfo()
     values = CurrentValues()
 
@@ -1156,10 +1324,12 @@ def get_data(idn, ch):
             ch.value, idn.value
         )
     )
-    err = BL_GetData(idn, ch, c.byref(data), c.byref(info), c.byref(values))
+    err = BL_GetData(idn, ch, buf, c.byref(info), c.byref(values))
 
     validate(err)
-    return (data, info, values)
+    size = min(info.NbRows * info.NbCols, DATA_BUFFER_SIZE)
+    data = (c.c_uint32 * size).from_buffer_copy(buf)
+    return TechData(data, info, values)
 
 
 async def connect_async(address, timeout=5):
@@ -1170,13 +1340,13 @@ async def connect_async(address, timeout=5):
     :returns: A tuple of ( id, info ), where id is the connection id,
         and info is a DeviceInfo structure.
     """
-    address = c.create_string_buffer(address.encode("utf-8"))
+    address = address.encode("utf-8")
     timeout = c.c_uint8(timeout)
     idn = c.c_int32()
     info = DeviceInfo()
 
-    logging.debug("[easy-biologic] Connecting to device {}.".format(address.value))
-    err = await BL_Connect_async(c.byref(address), timeout, c.byref(idn), c.byref(info))
+    logging.debug("[easy-biologic] Connecting to device {}.".format(address))
+    err = await BL_Connect_async(address, timeout, c.byref(idn), c.byref(info))
 
     validate(err)
     return (idn.value, info)
@@ -1189,7 +1359,7 @@ async def disconnect_async(idn):
     """
     idn = c.c_int32(idn)
 
-    logging.debug("[easy-biologic] Disconnecting from device {}.".format(idn.vlaue))
+    logging.debug("[easy-biologic] Disconnecting from device {}.".format(idn.value))
     err = await BL_Disconnect_async(idn)
     validate(err)
 
@@ -1234,25 +1404,17 @@ async def init_channels_async(
     idn = c.c_int32(idn)
     show_gauge = c.c_bool(False)
 
-    bin_file = (
-        c.c_void_p()
-        if (bin_file is None)
-        else c.byref(c.create_string_buffer(bin_file.encode("utf-8")))
-    )
+    bin_file = None if (bin_file is None) else bin_file.encode("utf-8")
 
-    xlx_file = (
-        c.c_void_p()
-        if (xlx_file is None)
-        else c.byref(c.create_string_buffer(xlx_file.encode("utf-8")))
-    )
+    xlx_file = None if (xlx_file is None) else xlx_file.encode("utf-8")
 
     logging.debug(
         "[easy-biologic] Initializing channels {} on device {}.".format(chs, idn.value)
     )
     err = await BL_LoadFirmware_async(
         idn,
-        c.byref(active),
-        c.byref(results),
+        active,
+        results,
         length,
         show_gauge,
         force_reload,
@@ -1274,7 +1436,7 @@ async def is_channel_connected_async(idn, ch):
     )
     conn = await BL_IsChannelPlugged_async(idn, ch)
 
-    return conn.value
+    return conn
 
 
 async def get_channels_async(idn, size=16):
@@ -1286,10 +1448,10 @@ async def get_channels_async(idn, size=16):
     """
     idn = c.c_int32(idn)
     channels = (c.c_uint8 * size)()
-    size = c.c_int32(size)
+    size = c.c_uint8(size)
 
     logging.debug("[easy-biologic] Getting channels on device {}.".format(idn.value))
-    err = await BL_GetChannelsPlugged_async(idn, c.byref(channels), size)
+    err = await BL_GetChannelsPlugged_async(idn, channels, size)
 
     validate(err)
     return [(ch == 1) for ch in channels]
@@ -1395,7 +1557,7 @@ async def load_technique_async(
     ch = c.c_uint8(ch)
 
     technique_path = technique_file(technique, device)
-    technique = c.create_string_buffer(technique_path.encode("utf-8"))
+    technique = technique_path.encode("utf-8")
 
     first = c.c_bool(first)
     last = c.c_bool(last)
@@ -1406,13 +1568,47 @@ async def load_technique_async(
             ch.value, idn.value
         )
     )
-    err = await BL_LoadTechnique_async(
-        idn, ch, c.byref(technique), params, first, last, verbose
-    )
+    err = await BL_LoadTechnique_async(idn, ch, technique, params, first, last, verbose)
 
     validate(err)
 
 
+async def load_techniques_async(
+    idn, ch, techniques, params, device=None, verbose=False
+):
+    """Loads a sequence of techniques onto a specified device channel.
+
+    :param idn: Device id.
+    :param ch: Channel.
+    :param techniques: List of technique file names, in order.
+    :param params: List of EccParams structures, one for each technique.
+    :param device: Type of device. Used to modify techniques.
+        [Default: None]
+    :param verbose: Echoes the sent parameters for debugging. [Default: False]
+    """
+    idn = c.c_int32(idn)
+    ch = c.c_uint8(ch)
+    verbose = c.c_bool(verbose)
+    last_index = len(techniques) - 1
+
+    logging.debug(
+        "[easy-biologic] Loading {} techniques to channel {} on device {}.".format(
+            len(techniques), ch.value, idn.value
+        )
+    )
+    for index, (technique, tech_params) in enumerate(zip(techniques, params)):
+        technique_path = technique_file(technique, device)
+        technique = technique_path.encode("utf-8")
+
+        first = c.c_bool(index == 0)
+        last = c.c_bool(index == last_index)
+
+        err = await BL_LoadTechnique_async(
+            idn, ch, technique, tech_params, first, last, verbose
+        )
+        validate(err)
+
+
 async def update_parameters_async(idn, ch, technique, params, index=0, device=None):
     """Updates the parameters of a technique.
 
@@ -1429,7 +1625,7 @@ async def update_parameters_async(idn, ch, technique, params, index=0, device=No
     ch = c.c_uint8(ch)
 
     technique = technique_file(technique, device)
-    technique = c.create_string_buffer(technique.encode("utf-8"))
+    technique = technique.encode("utf-8")
     index = c.c_int32(index)
 
     logging.debug(
@@ -1437,7 +1633,7 @@ async def update_parameters_async(idn, ch, technique, params, index=0, device=No
             ch.value, idn.value
         )
     )
-    err = await BL_UpdateParameters_async(idn, ch, index, params, c.byref(technique))
+    err = await BL_UpdateParameters_async(idn, ch, index, params, technique)
 
     validate(err)
 
@@ -1473,7 +1669,7 @@ async def start_channels_async(idn, chs):
     logging.debug(
         "[easy-biologic] Starting channels {} on device {}.".format(chs, idn.value)
     )
-    err = await BL_StartChannel_async(idn, c.byref(active), c.byref(results), num_chs)
+    err = await BL_StartChannels_async(idn, active, results, num_chs)
 
     validate(err)
 
@@ -1509,21 +1705,25 @@ async def stop_channels_async(idn, chs):
     logging.debug(
         "[easy-biologic] Stopping channels {} on device {}.".format(chs, idn.value)
     )
-    err = await BL_StopChannel_async(idn, c.byref(active), c.byref(results), num_chs)
+    err = await BL_StopChannels_async(idn, active, results, num_chs)
 
     validate(err)
 
 
-async def get_values_async(idn, ch):
+async def get_values_async(idn, ch, values=None):
     """Gets the current data values on the given device channel.
 
     :param idn: Device identifier.
     :param ch: Channel.
+    :param values: CurrentValues object to fill, or None to create a new one.
+        Reusing an object avoids an allocation when polling.
+        [Default: None]
     :returns: CurrentValues object.
     """
     idn = c.c_int32(idn)
     ch = c.c_uint8(ch)
-    values = CurrentValues()
+    if values is None:
+        values = CurrentValues()
 
     logging.debug(
         "[easy-biologic] Getting values from channel {} on device {}.".format(
@@ -1542,14 +1742,14 @@ async def get_data_async(idn, ch):
 
     :param idn: Device identifier.
     :param ch: Channel.
-    :returns: A tuple of ( data, data_info, current_values ) where
-        data_info is a DataInfo object representing the data's metadata,
-        data is a data array, and
+    :returns: A TechData tuple of ( data, data_info, current_values ) where
+        data is the raw data buffer,
+        data_info is a DataInfo object representing the data's metadata, and
         current_values is a CurrentValues object.
     """
     idn = c.c_int32(idn)
     ch = c.c_uint8(ch)
-    data = (c.c_uint32 * 1000)()
+    data = (c.c_uint32 * DATA_BUFFER_SIZE)()
     info = DataInfo()
     values = CurrentValues()
 
@@ -1558,10 +1758,10 @@ async def get_data_async(idn, ch):
             ch.value, idn.value
         )
     )
-    err = await BL_GetData_async(idn, ch, c.byref(data), c.byref(info), c.byref(values))
+    err = await BL_GetData_async(idn, ch, data, c.byref(info), c.byref(values))
 
     validate(err)
-    return (data, info, values)
+    return TechData(data, info, values)
 
 
 def validate(err):
@@ -1579,19 +1779,20 @@ def validate(err):
         raise EcError(err)
 
 
-def create_active_array(active, size=None, kind=c.c_uint8):
+def create_active_array(active, size=None, kind=c.c_uint8, reuse=False):
     """Creates an array of active elements from a list.
 
     :param active: List of active elements.
     :param size: Size of the array. If None the maximum active index is used.
         [Default: None]
     :param kind: Kind of array elements. [Default: ctypes.c_uint8]
+    :param reuse: Use a scratch array, see #scratch_array. [Default: False]
     :returns: An array of elements where active elements are 1, and inactive are 0.
     """
     if size is None:
         size = max(active) + 1
 
-    arr = (kind * size)()
+    arr = scratch_array(kind, size) if reuse else (kind * size)()
     for index in active:
         # activate index
         arr[index] = 1
@@ -1599,6 +1800,30 @@ def create_active_array(active, size=None, kind=c.c_uint8):
     return arr
 
 
+def scratch_array(kind, size):
+    """Returns a zeroed array that is reused by later calls on the same thread.
+    The array is only valid until the next call with the same kind and size,
+    so it must not be returned or held across an await.
+
+    :param kind: Kind of array elements.
+    :param size: Size of the array.
+    :returns: A zeroed array.
+    """
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _scratch.buffers = {}
+
+    arr = buffers.get((kind, size))
+    if arr is None:
+        arr = buffers[(kind, size)] = (kind * size)()
+
+    else:
+        c.memset(arr, 0, c.sizeof(arr))
+
+    return arr
+
+
+@functools.lru_cache(maxsize=64)
 def technique_file(technique, device=None):
     """Returns the file name of teh given technique for the given device.
 
@@ -1,5 +1,10 @@
+import io
 import os
+import csv
+import time
 import logging
+import itertools
+import queue
 import signal
 import asyncio
 import threading
@@ -34,6 +39,16 @@ else:
         pd_csv_kwargs["line_terminator"] = "\n"
 
 
+# number of rows formatted per batch when saving data
+WRITE_BATCH_ROWS = 4096
+
+# file buffer size in bytes when saving data
+WRITE_BUFFER_SIZE = 1 << 20
+
+# maximum number of pending background saves
+SAVE_QUEUE_SIZE = 8
+
+
 DataSegment = namedtuple(
     "DataSegment",
     [
@@ -48,12 +63,26 @@ DataSegment = namedtuple(
 CallBack = namedtuple("CallBack", ["function", "args", "kwargs"])
 
 
+def write_rows(open_file, rows):
+    """Writes rows of data to a file as CSV, one line per row.
+    None values are written as empty fields.
+
+    :param open_file: File object opened for writing.
+    :param rows: Iterable of data rows.
+    """
+    csv.writer(open_file, lineterminator="\n").writerows(rows)
+
+
 class BiologicProgram(ABC):
     """Represents a Biologic Program.
 
     Stores data.
     """
 
+    # raw channel state values, for comparison without enum lookups
+    _STOP_STATE = ecl.ChannelState.STOP.value
+    _RUN_STATE = ecl.ChannelState.RUN.value
+
     def __init__(
         self,
         device,
@@ -91,6 +120,12 @@ class BiologicProgram(ABC):
         :write_attempts: Number of attempts to try to write data, after which an exception is raised.
             If None, never raise an exception.
             [Default: 0]
+        :save_in_background: Write data from a background thread,
+            so #save_data returns without waiting for the write.
+            Errors are logged instead of raised.
+            Use #wait_for_saves to wait for pending writes
+            and stop the background thread.
+            [Default: False]
         :field_titles: List of names for each field to be used when writing data.
             Should have same length as number of fields.
         :_fields: A named tuple representing the program data.
@@ -107,9 +142,13 @@ class BiologicProgram(ABC):
         self.device = device
         self.autoconnect = autoconnect
         self.barrier = barrier
-        self.field_titles = []  # column names for saving data
         self.write_attempts = 0
+        self.save_in_background = False
         self._writes_failed = 0
+        self._write_header = True  # header not yet written
+        self._save_folder = None  # folder known to exist for saving
+        self._save_queue = None  # pending background saves
+        self._save_thread = None  # background writer
 
         if channels is None:
             # assume channels from params
@@ -121,6 +160,9 @@ class BiologicProgram(ABC):
             self.params = {ch: params.copy() for ch in channels}
             self._channels = channels
 
+        self._channel_set = frozenset(self.channels)  # for fast membership
+        self.field_titles = []  # column names for saving data
+
         self._techniques = []  # program techniques
         self._fields = None  # program fields object
         self._field_values = None  # fucntion to compute program fields
@@ -128,9 +170,9 @@ class BiologicProgram(ABC):
         self._parameter_types = None  # parameter types for the technique
 
         self._data = {ch: [] for ch in self.channels}  # data store
-        self._unsaved_data = {
-            ch: [] for ch in self.channels
-        }  # data store for unwritten data
+        self._save_cursor = {
+            ch: 0 for ch in self.channels
+        }  # index of first unwritten datum
         self.data_window = None  # initialize to keep all data
 
         self._threaded = threaded
@@ -186,6 +228,29 @@ class BiologicProgram(ABC):
             # static value
             self._data_window = {ch: value for ch in self.channels}
 
+    @property
+    def field_titles(self):
+        """
+        :returns: List of names for each field used when writing data.
+        """
+        return self._field_titles
+
+    @field_titles.setter
+    def field_titles(self, value):
+        """Sets the field titles, building the file headers once.
+        Assign a new list to update the headers.
+
+        :param value: List of names for each field.
+        """
+        self._field_titles = value
+
+        titles = ",".join(value)
+        self._field_header = titles + "\n"
+        self._channel_header = (
+            ",".join(str(ch) for ch in self.channels for _ in value) + "\n"
+        )
+        self._title_header = ",".join([titles] * len(self.channels)) + "\n"
+
     @property
     def fields(self):
         """
@@ -281,26 +346,58 @@ class BiologicProgram(ABC):
             If False, file should be a file path.
             [Default: False]
         """
-        if append is False:
-            if not hasattr(self, "_write_header"):
-                self._write_header = True
-            else:
-                # header already written
-                # append to file
-                append = True
-        else:
-            # don't write header if appending
+        if self.save_in_background:
+            if self._save_thread is None:
+                # start writer thread
+                self._save_queue = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+                self._save_thread = threading.Thread(
+                    target=self._save_worker, args=(self._save_queue,), daemon=True
+                )
+                self._save_thread.start()
+
+            # hand the writer a snapshot of the unsaved data,
+            # so it never reads data while it is being acquired or trimmed
+            append, write_header = self._save_mode(append)
+            unsaved = self._unsaved_data()
+            self._advance_save_cursors(
+                {ch: len(ch_data) for ch, ch_data in unsaved.items()}
+            )
             self._write_header = False
+            self.trim_data()
+
+            # blocks if too many saves are pending
+            self._save_queue.put((file, unsaved, append, by_channel, write_header))
+            return
+
+        self._save_data(file, append=append, by_channel=by_channel)
+
+    def wait_for_saves(self):
+        """Waits for pending background saves to complete,
+        then stops the background thread.
+        A later background save starts a new thread.
+        """
+        if self._save_thread is None:
+            return
+
+        self._save_queue.put(None)  # stop signal
+        self._save_thread.join()
 
+        self._save_queue = None
+        self._save_thread = None
+
+    def _save_data(self, file, append=False, by_channel=False):
+        """Saves data to a CSV file.
+        [See #save_data]
+        """
+        append, write_header = self._save_mode(append)
         try:
-            if by_channel:
-                self._save_data_individual(
-                    file, append=append, write_header=self._write_header
-                )
-            else:
-                self._save_data_together(
-                    file, append=append, write_header=self._write_header
-                )
+            written = self._write_unsaved(
+                file,
+                self._unsaved_data(),
+                append=append,
+                by_channel=by_channel,
+                write_header=write_header,
+            )
         except Exception as err:
             self._writes_failed += 1
 
@@ -315,10 +412,58 @@ class BiologicProgram(ABC):
             # successful write
             # reset failed attempts
             self._writes_failed = 0
+            self._advance_save_cursors(written)
 
         # drop data outside data window
         self.trim_data()
 
+    def _save_mode(self, append):
+        """
+        :param append: True to append to file, false to overwrite.
+        :returns: Tuple of ( append, write_header ) for the next write.
+        """
+        if append is False:
+            if not self._write_header:
+                # header already written
+                # append to file
+                append = True
+        else:
+            # don't write header if appending
+            self._write_header = False
+
+        return (append, self._write_header)
+
+    def _write_unsaved(
+        self, file, unsaved, append=False, by_channel=False, write_header=False
+    ):
+        """Writes unsaved data to a CSV file.
+
+        :param file: File or folder path. [See #save_data]
+        :param unsaved: Dictionary of data rows to write, keyed by channel.
+        :param append: True to append to file, false to overwrite.
+            [Default: False]
+        :param by_channel: Save each channel to own file. [Default: False]
+        :param write_header: Whether to write header or not.
+            [Default: False]
+        :returns: Dictionary of the number of rows written, keyed by channel.
+        """
+        if by_channel:
+            return self._save_data_individual(
+                file, unsaved, append=append, write_header=write_header
+            )
+
+        return self._save_data_together(
+            file, unsaved, append=append, write_header=write_header
+        )
+
+    def _advance_save_cursors(self, written):
+        """Marks data as written to file.
+
+        :param written: Dictionary of the number of rows written, keyed by channel.
+        """
+        for ch, count in written.items():
+            self._save_cursor[ch] += count
+
     def trim_data(self, window=None):
         """Trims data to a specific length.
 
@@ -334,20 +479,20 @@ class BiologicProgram(ABC):
             window = self.data_window
 
         # validate channels
-        invalid_channels = [ch for ch in window.keys() if ch not in self.channels]
-        if len(invalid_channels) > 0:
-            raise ValueError(f"Invalid channel(s): {invalid_channels}")
+        invalid_channels = window.keys() - self._channel_set
+        if invalid_channels:
+            raise ValueError(f"Invalid channel(s): {list(invalid_channels)}")
 
-        # trim data
+        # trim data, keeping unwritten data
         for ch, ch_window in window.items():
             if ch_window is None:
                 # don't trim data
                 continue
-            elif ch_window == 0:
-                # clear data
-                self._data[ch] = []
-            else:
-                self._data[ch] = self._data[ch][-ch_window:]
+
+            drop = min(len(self._data[ch]) - ch_window, self._save_cursor[ch])
+            if drop > 0:
+                del self._data[ch][:drop]
+                self._save_cursor[ch] -= drop
 
     def sync(self):
         """Waits for barrier, if set."""
@@ -364,12 +509,12 @@ class BiologicProgram(ABC):
 
     def _connect(self):
         """Connects device if needed."""
-        if not self.device.is_connected():
+        if not self.device.is_connected(cached=True):
             self.device.connect()
 
     def _disconnect(self):
         """Disconnects device."""
-        if self.device.is_connected():
+        if self.device.is_connected(cached=True):
             self.device.disconnect()
 
     def _run(self, technique, params, read_interval=1, retrieve_data=True):
@@ -422,8 +567,7 @@ class BiologicProgram(ABC):
                 self._fields(*self._field_values(datum, segment))
                 for datum in segment.data
             ]
-            self._data[channel] += parsed
-            self._unsaved_data[channel] += parsed
+            self._data[channel].extend(parsed)
 
         # run callbacks
         for cb in self._cb_data:
@@ -441,11 +585,12 @@ class BiologicProgram(ABC):
         if channels is None:
             channels = self.channels
 
-        segments = {}
-        for ch in channels:
-            segments[ch] = await self._retrieve_data_segment(ch)
+        # retrieve channels concurrently
+        segments = await asyncio.gather(
+            *[self._retrieve_data_segment(ch) for ch in channels]
+        )
 
-        return segments
+        return dict(zip(channels, segments))
 
     async def _retrieve_data(self, interval=1):
         """Retrieves data from the device until it is stopped.
@@ -457,24 +602,27 @@ class BiologicProgram(ABC):
             [ data, info, values ], keyed by channel.
         """
         complete = {ch: False for ch in self.channels}
+        deadline = time.monotonic()
         while not all(complete.values()):
-            if (  # stop signal received
-                self._stop_event is not None and self._stop_event.is_set()
-            ):
-                logging.warning(f"Halting program on channel {self.channel}.")
+            # schedule from the previous deadline to avoid drift
+            deadline += interval
+            now = time.monotonic()
+            if deadline < now:
+                # retrieval overran, restart schedule instead of catching up
+                deadline = now + interval
 
-                break
+            if await self._wait(deadline - now):
+                # stop signal received
+                logging.warning(f"Halting program on channels {self.channels}.")
 
-            await asyncio.sleep(interval)  # wait
+                break
 
             # retrieve data
             active_channels = [ch for ch, done in complete.items() if (not done)]
             segments = await self._retrieve_data_segments(active_channels)
 
             for ch, ch_segment in segments.items():
-                done = (
-                    ecl.ChannelState(ch_segment.values.State) is ecl.ChannelState.STOP
-                )
+                done = ch_segment.values.State == self._STOP_STATE
                 complete[ch] = done
                 if done:
                     # Get all remaining data from channel
@@ -485,10 +633,84 @@ class BiologicProgram(ABC):
 
                     logging.debug(f"Channel {ch} complete.")
 
-    def _write_data_together_pandas(self, open_file):
+    def _unsaved_data(self):
+        """
+        :returns: Dictionary of tuples of data not yet written to file,
+            keyed by channel.
+        """
+        return {
+            ch: tuple(ch_data[self._save_cursor[ch] :])
+            for ch, ch_data in self._data.items()
+        }
+
+    def _save_worker(self, save_queue):
+        """Performs queued saves, for saving in the background.
+        Runs until a None stop signal is received.
+
+        :param save_queue: Queue of saves to perform.
+        """
+        pending = {}  # rows of failed writes, kept in order for the next save
+        pending_header = False  # header of a failed write
+        while True:
+            save = save_queue.get()
+            try:
+                if save is None:
+                    # stop signal
+                    unwritten = sum(map(len, pending.values()))
+                    if unwritten:
+                        logging.warning(
+                            f"[#save_data] Channels {self.channels}: "
+                            f"{unwritten} data points could not be written."
+                        )
+
+                    return
+
+                file, unsaved, append, by_channel, write_header = save
+                unsaved = {
+                    ch: pending.get(ch, ()) + ch_data for ch, ch_data in unsaved.items()
+                }
+                write_header = write_header or pending_header
+
+                try:
+                    written = self._write_unsaved(
+                        file,
+                        unsaved,
+                        append=append,
+                        by_channel=by_channel,
+                        write_header=write_header,
+                    )
+                except Exception as err:
+                    logging.warning(f"[#save_data] Channels {self.channels}: {err}")
+                    written = {}
+                    pending_header = write_header
+                else:
+                    pending_header = False
+
+                pending = {
+                    ch: ch_data[written.get(ch, 0) :] for ch, ch_data in unsaved.items()
+                }
+
+            finally:
+                save_queue.task_done()
+
+    async def _wait(self, timeout):
+        """Waits for the given time, returning early if the stop event is set.
+
+        :param timeout: Time to wait in seconds.
+        :returns: True if the stop event is set, False otherwise.
+        """
+        if self._stop_event is None:
+            await asyncio.sleep(timeout)
+            return False
+
+        return await asyncio.to_thread(self._stop_event.wait, timeout)
+
+    def _write_data_together_pandas(self, open_file, unsaved):
         """Write data from all channels to an open file using pandas.
 
         :param open_file: File object opened for writing
+        :param unsaved: Dictionary of data rows to write, keyed by channel.
+        :returns: Dictionary of the number of rows written, keyed by channel.
         :raises ImportError: if pandas not installed
         """
         if not _pandas_installed:
@@ -496,7 +718,7 @@ class BiologicProgram(ABC):
 
         # Get dataframe for each channel
         ch_dataframes = {}
-        for ch, ch_data in self._unsaved_data.items():
+        for ch, ch_data in unsaved.items():
             ch_dataframes[ch] = pd.DataFrame(ch_data, columns=self.field_titles)
 
         # Join all dataframes
@@ -507,160 +729,135 @@ class BiologicProgram(ABC):
 
         try:
             open_file.write(txt)
-
-            # data written, remove data from unsaved
-            for ch in ch_dataframes.keys():
-                self._unsaved_data[ch] = []
         except Exception as err:
             logging.warning(f"Error writing data: {err}")
+            return {}
 
-    def _write_data_together_default(
-        self,
-        open_file,
-    ):
-        """Write data from all channels to an open file using default file.write method.
-
-        :param open_file: File object opened for writing
-        """
-        # get maximum rows
-        num_rows = {ch: len(data) for ch, data in self._unsaved_data.items()}
-        written = {ch: [] for ch in self._unsaved_data.keys()}
-        for index in range(max(num_rows.values())):
-            written_row = {ch: None for ch in self._unsaved_data.keys()}
-            row_data = ""
-            for ch, ch_data in self._unsaved_data.items():
-                if index < num_rows[ch]:
-                    # valid row for channel
-                    ch_datum = ch_data[index]
-                    row_data += ",".join(map(self._datum_to_str, ch_datum)) + ","
-                    written_row[ch] = ch_datum
-                else:
-                    # channel data exhausted, write placeholders
-                    num_titles = len(self.field_titles)
-                    row_data += "," * num_titles
+        return {ch: len(dataframe) for ch, dataframe in ch_dataframes.items()}
 
-            # new row
-            row_data = row_data[:-1] + "\n"
+    def _write_data_together_default(self, open_file, unsaved):
+        """Write data from all channels to an open file using a csv writer.
 
+        :param open_file: File object opened for writing
+        :param unsaved: Dictionary of data rows to write, keyed by channel.
+        :returns: Dictionary of the number of rows written, keyed by channel.
+        """
+        total_rows = max(map(len, unsaved.values()), default=0)
+
+        # transpose channels into rows, padding exhausted channels
+        placeholder = (None,) * len(self.field_titles)
+        rows = map(
+            itertools.chain.from_iterable,
+            itertools.zip_longest(*unsaved.values(), fillvalue=placeholder),
+        )
+
+        # write rows in batches
+        # each batch is formatted in memory first,
+        # so a failed batch leaves no partial rows in the file
+        written = 0  # rows written, in order
+        for start in range(0, total_rows, WRITE_BATCH_ROWS):
+            stop = min(start + WRITE_BATCH_ROWS, total_rows)
             try:
-                open_file.write(row_data)
+                batch = io.StringIO()
+                write_rows(batch, itertools.islice(rows, stop - start))
+                open_file.write(batch.getvalue())
             except Exception as err:
+                # keep remaining rows for next write to preserve order
                 logging.warning(f"Error writing data: {err}")
+                break
             else:
                 # successful write
-                for ch, ch_datum in written_row.items():
-                    written[ch].append(ch_datum)
+                written = stop
 
-        # data written, remove data from unsaved
-        for ch, ch_data in written.items():
-            self._unsaved_data[ch] = [
-                datum for datum in ch_data if datum not in written[ch]
-            ]
+        return {ch: min(written, len(ch_data)) for ch, ch_data in unsaved.items()}
 
-    def _save_data_together(self, file, append=False, write_header=False):
+    def _save_data_together(self, file, unsaved, append=False, write_header=False):
         """Saves data to a CSV file.
 
         :param file: File path.
+        :param unsaved: Dictionary of data rows to write, keyed by channel.
         :param append: True to append to file, false to overwrite.
             [Default: False]
         :param write_header: Whether to write header or not.
             [Default: False]
+        :returns: Dictionary of the number of rows written, keyed by channel.
         """
+        if not (write_header or any(unsaved.values())):
+            # nothing to write
+            return {}
+
         mode = "a" if append else "w"
         try:
-            with open(file, mode) as f:
-                num_titles = len(self.field_titles)
-
+            with open(file, mode, buffering=WRITE_BUFFER_SIZE) as f:
                 if write_header:
                     # write header only if not appending
                     # write channel header if multichanneled
-                    ch_header = ""
-                    for ch in self.channels:
-                        ch_header += f"{ch}," * num_titles
-
-                    # replace last comma with line end
-                    ch_header = ch_header[:-1] + "\n"
-
-                    f.write(ch_header)
+                    f.write(self._channel_header)
 
                     # field titles
-                    title_header = ""
-                    for _ in self.channels:
-                        # create titles for each channnel
-                        title_header += ",".join(self.field_titles) + ","
-
-                    # replace last comma with new line
-                    title_header = title_header[:-1] + "\n"
-
                     try:
-                        f.write(title_header)
+                        f.write(self._title_header)
                     except Exception as err:
                         logging.warning(f"Error writing header: {err}")
 
                 # write data
                 if _pandas_installed:
-                    self._write_data_together_pandas(f)
+                    return self._write_data_together_pandas(f, unsaved)
                 else:
-                    self._write_data_together_default(f)
+                    return self._write_data_together_default(f, unsaved)
 
         except Exception as err:
             if self._threaded:
-                logging.warning(f"[#save_data] CH{ch}: {err}")
+                logging.warning(f"[#save_data] Channels {self.channels}: {err}")
+                return {}
             else:
                 raise err
 
-    def _save_data_individual(self, folder, append=False, write_header=False):
+    def _save_data_individual(self, folder, unsaved, append=False, write_header=False):
         """Saves data to a CSV file.
 
         :param folder: Folder path.
+        :param unsaved: Dictionary of data rows to write, keyed by channel.
         :param append: True to append to file, false to overwrite.
             [Default: False]
         :param write_header: Whether to write header or not.
             [Default: False]
+        :returns: Dictionary of the number of rows written, keyed by channel.
         """
+        if not (write_header or any(unsaved.values())):
+            # nothing to write
+            return {}
+
         mode = "a" if append else "w"
 
-        if not os.path.exists(folder):
-            os.makedirs(folder)
+        if folder != self._save_folder:
+            # folder not yet ensured
+            os.makedirs(folder, exist_ok=True)
+            self._save_folder = folder
 
-        for ch, ch_data in self._unsaved_data.items():
+        written = {}
+        for ch, ch_data in unsaved.items():
             file = os.path.join(folder, f"ch-{ch}.csv")
-
-            if _pandas_installed:
-                dataframe = pd.DataFrame(ch_data, columns=self.field_titles)
-                csv_data = dataframe.to_csv(**pd_csv_kwargs)
-            else:
-                csv_data = ""
-                for datum in ch_data:
-                    csv_data += ",".join(map(self._datum_to_str, datum))
-                    csv_data += "\n"
-
             try:
-                with open(file, mode) as f:
+                with open(file, mode, buffering=WRITE_BUFFER_SIZE) as f:
                     if write_header:
                         # write header only if not appending
-                        f.write(",".join(self.field_titles) + "\n")
-
-                    # write data
-                    f.write(csv_data)
+                        f.write(self._field_header)
+
+                    # stream data to file
+                    if _pandas_installed:
+                        dataframe = pd.DataFrame(ch_data, columns=self.field_titles)
+                        dataframe.to_csv(f, **pd_csv_kwargs)
+                    else:
+                        write_rows(f, ch_data)
             except Exception as err:
                 logging.warning(f"[#_save_data_individual] CH{ch}: {err}")
+                self._save_folder = None  # recheck folder on next save
             else:
                 # data written successfully
-                self._unsaved_data[ch] = []
-
-    def _datum_to_str(self, datum):
-        """Casts data to string.
-        If datum is None, casts to empty string intead of 'None'.
-
-        :param datum: Datum to cast.
-        :returns: Datum as a string.
-        """
-        if datum is None:
-            return ""
+                written[ch] = len(ch_data)
 
-        # datum is not None
-        return str(datum)
+        return written
 
 
 class ProgramRunner:
@@ -19,7 +19,7 @@ def create_path (base_path):
 	:returns: Save path
 	'''
 	dirs = os.listdir (base_path)
-	if len (dirs) is 0:
+	if len (dirs) == 0:
 		run = 0
 	else:
 		runs = [int (dir.replace ('trial-', '')) for dir in dirs]